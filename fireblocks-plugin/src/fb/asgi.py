@@ -0,0 +1,345 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+""""""
+
+import asyncio
+import io
+import logging
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from uuid import UUID
+
+from flask import Flask, Response
+from werkzeug.exceptions import HTTPException, NotFound
+from werkzeug.wrappers import Request
+
+from oso.framework.plugin import current_oso_plugin_app
+
+from .plugin import FBPlugin
+from .types import (
+    MessageEnvelope,
+    MessagesRequest,
+    MessagesStatusRequest,
+    MessagesStatusResponse,
+    MessageStatus,
+)
+from .utils import model_dump_json_bytes
+
+
+logger = logging.getLogger(__name__)
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class CustomerServerASGI:
+    """asyncio-native front for the OSO Flask application.
+
+    Run with any ASGI server, e.g. ``uvicorn --factory fb.asgi:create_asgi_app``.
+    The customer server routes are served on the event loop, and in hot mode
+    every envelope's signing call is awaited on a thread pool, so an open agent
+    connection never pins a worker. Every other route goes to Flask unchanged.
+    """
+
+    ROUTES = {
+        "/internal/messagesToSign": "messagesToSign",
+        "/internal/messagesStatus": "messagesStatus",
+    }
+
+    def __init__(self, flask_app: Flask, max_threads: Optional[int] = None) -> None:
+        self.flask_app = flask_app
+
+        with flask_app.app_context():
+            self.plugin = current_oso_plugin_app()
+            assert isinstance(self.plugin, FBPlugin)
+
+            self.mode = self.plugin.mode
+
+        # Runs the blocking parts: Flask request hooks, store access and the
+        # signing server calls
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_threads or 4 * self.plugin.config.sign_concurrency,
+            thread_name_prefix="fb-asgi",
+        )
+
+        # Hot mode signing calls in progress, by request
+        self.signing: dict[UUID, asyncio.Future[MessageStatus]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        match scope["type"]:
+            case "lifespan":
+                await self.lifespan(receive, send)
+
+            case "http":
+                body = await read_body(receive)
+                environ = build_environ(scope, body)
+
+                match self.ROUTES.get(scope["path"]), scope["method"]:
+                    case str(view), "POST":
+                        response = await self.customer_server(view, environ, body)
+
+                    case _:
+                        response = await self.run(self.wsgi, environ)
+
+                await send_response(send, response)
+
+            case "websocket":
+                # Closing before accepting rejects the handshake
+                await receive()
+                await send({"type": "websocket.close", "code": 1003})
+
+            case _:
+                raise RuntimeError(f"Unsupported ASGI scope type {scope['type']!r}")
+
+    async def lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+
+            match message["type"]:
+                case "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+
+                case "lifespan.shutdown":
+                    self.executor.shutdown(wait=False)
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+    async def customer_server(
+        self, view: str, environ: dict[str, Any], body: bytes
+    ) -> Response:
+        # Same authentication and routing hooks as the Flask views
+        rejected = await self.run(self.preprocess, environ)
+
+        if rejected is not None:
+            return rejected
+
+        try:
+            match view:
+                case "messagesToSign":
+                    messages_request = MessagesRequest.model_validate_json(body)
+
+                    config = self.plugin.config
+
+                    if config.hot_mode and not config.hot_mode_async:
+                        messages_status_response = await self.hot_sign(messages_request)
+
+                    else:
+                        messages_status_response = await self.run_in_app(
+                            self.plugin.messagesToSign, messages_request
+                        )
+
+                case _:
+                    messages_status_request = MessagesStatusRequest.model_validate_json(
+                        body
+                    )
+                    wait = Request(environ).args.get("wait", type=float)
+
+                    # Long-polls wait on the loop, not on an executor thread
+                    if wait is not None and wait > 0:
+                        await self.wait_for_signed(
+                            list(dict.fromkeys(messages_status_request.requestsIds)),
+                            min(wait, self.plugin.config.status_max_wait),
+                        )
+
+                    messages_status_response = await self.run_in_app(
+                        self.plugin.messagesStatus, messages_status_request
+                    )
+
+        except HTTPException as e:
+            return e.get_response()
+
+        except Exception as e:
+            logger.error("Could not handle %s", view)
+            logger.debug("Request: %r, Error: %s", body, e)
+            return Response(f"Could not handle {view}", status=400)
+
+        return Response(
+            model_dump_json_bytes(messages_status_response) + b"\n",
+            mimetype="application/json",
+        )
+
+    async def hot_sign(
+        self, messages_request: MessagesRequest
+    ) -> MessagesStatusResponse:
+        """Sign every envelope concurrently, awaiting each signing call."""
+        if self.mode != "frontend":
+            raise NotFound("messagesToSign() not supported in backend mode")
+
+        statuses = await asyncio.gather(
+            *(self.sign_once(message) for message in messages_request.messages)
+        )
+
+        await self.run_in_app(self.plugin.claimed_statuses.evict)
+
+        return MessagesStatusResponse(statuses=list(statuses))
+
+    async def sign_once(self, message: MessageEnvelope) -> MessageStatus:
+        """Sign ``message``, sharing the signing call of a request being signed.
+
+        Duplicates in one request and retries arriving mid-sign wait for the
+        same call, so an envelope is never signed twice.
+        """
+        request_id = message.transportMetadata.requestId
+        signing = self.signing.get(request_id)
+
+        if signing is None:
+            signing = self.signing[request_id] = asyncio.ensure_future(
+                self.run_in_app(self.plugin.hot_sign, message)
+            )
+            # Only once the status is claimed, so the next retry finds it
+            signing.add_done_callback(lambda _: self.signing.pop(request_id, None))
+
+        # A cancelled caller must not cancel the others
+        return await asyncio.shield(signing)
+
+    async def wait_for_signed(self, request_ids: list[UUID], timeout: float) -> None:
+        """Like ``FBPlugin.wait_for_signed``, without holding a thread."""
+        if not await self.run_in_app(self.plugin.being_signed, request_ids):
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        signed = asyncio.Event()
+
+        def notify() -> None:
+            loop.call_soon_threadsafe(signed.set)
+
+        self.plugin.signed_listeners.add(notify)
+
+        try:
+            while True:
+                # Cleared before looking, so a notification in between is kept
+                signed.clear()
+
+                if await self.run_in_app(self.plugin.any_signed, request_ids):
+                    return
+
+                remaining = deadline - loop.time()
+
+                if remaining <= 0:
+                    return
+
+                # Results stored by other workers are not notified, look again
+                # every so often
+                try:
+                    await asyncio.wait_for(
+                        signed.wait(),
+                        min(remaining, self.plugin.config.status_poll_interval),
+                    )
+
+                except TimeoutError:
+                    pass
+
+        finally:
+            self.plugin.signed_listeners.discard(notify)
+
+    def preprocess(self, environ: dict[str, Any]) -> Optional[Response]:
+        with self.flask_app.request_context(environ):
+            rv = self.flask_app.preprocess_request()
+
+            if rv is not None:
+                return self.flask_app.make_response(rv)
+
+        return None
+
+    def wsgi(self, environ: dict[str, Any]) -> Response:
+        return Response.from_app(self.flask_app.wsgi_app, environ)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, fn, *args
+        )
+
+    async def run_in_app(self, fn: Callable[..., Any], *args: Any) -> Any:
+        def _fn() -> Any:
+            with self.flask_app.app_context():
+                return fn(*args)
+
+        return await self.run(_fn)
+
+
+async def read_body(receive: Receive) -> bytes:
+    chunks = []
+
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+def build_environ(scope: Scope, body: bytes) -> dict[str, Any]:
+    """WSGI environ for an ASGI HTTP ``scope`` with a fully read ``body``."""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+
+    environ: dict[str, Any] = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", ""),
+        "PATH_INFO": scope["path"],
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server[0],
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+
+        elif name != "CONTENT_LENGTH":
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+
+    return environ
+
+
+async def send_response(send: Send, response: Response) -> None:
+    headers: Iterable[tuple[str, str]] = response.headers.items()
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": response.get_data()})
+
+
+def create_asgi_app() -> CustomerServerASGI:
+    from oso.framework.plugin import create_app
+
+    return CustomerServerASGI(create_app())
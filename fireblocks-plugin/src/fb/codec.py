@@ -0,0 +1,48 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+""""""
+
+import base64
+import zlib
+
+from typing import Literal
+
+
+ContentEncoding = Literal["identity", "zlib"]
+
+# Version marker for compressed document content. Plain content is the JSON
+# document itself, so it can never start with this prefix.
+ZLIB_PREFIX = "fbz1:"
+
+
+def encode_content(content: str, encoding: ContentEncoding, level: int = 6) -> str:
+    """Encode document ``content`` for the trip across OSO."""
+    match encoding:
+        case "identity":
+            return content
+
+        case "zlib":
+            compressed = zlib.compress(content.encode(), level)
+            return ZLIB_PREFIX + base64.b64encode(compressed).decode("ascii")
+
+
+def decode_content(content: str) -> str:
+    """Inverse of :func:`encode_content`, whatever encoding the sender used."""
+    if content.startswith(ZLIB_PREFIX):
+        compressed = base64.b64decode(content[len(ZLIB_PREFIX) :], validate=True)
+        return zlib.decompress(compressed).decode()
+
+    return content
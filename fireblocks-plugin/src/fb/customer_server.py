@@ -16,9 +16,8 @@
 """"""
 
 import logging
-import sys
 
-from flask import jsonify, request
+from flask import request
 from flask.views import MethodView
 
 from pydantic import ValidationError
@@ -26,9 +25,9 @@ from pydantic import ValidationError
 from oso.framework.plugin import current_oso_plugin_app
 
 from .types import MessagesRequest, MessagesStatusRequest, MessagesStatusResponse
-from .utils import model_dump
+from .log import Lazy
+from .utils import model_response
 
-logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 
@@ -38,25 +37,26 @@ class CustomerServerMessagesToSignApi(MethodView):
     ENDPOINT = "/".join(__name__.split(".")[-2:])
 
     def post(self):
-        json_data = request.get_json()
+        raw_data = request.get_data()
 
         try:
-            messages_request = MessagesRequest.model_validate(json_data)
+            # Validate straight from the body, without an intermediate dict
+            messages_request = MessagesRequest.model_validate_json(raw_data)
 
         except Exception as e:
-            logger.error("Could not validate MessagesStatusRequest")
-            logger.debug(f"Request: {json_data}, Error: {e}")
-            raise ValidationError("Could not validate MessagesStatusRequest")
+            logger.error("Could not validate MessagesRequest")
+            logger.debug("Request: %r, Error: %s", raw_data, e)
+            raise ValidationError("Could not validate MessagesRequest")
 
         messages_status_response: MessagesStatusResponse = (
             current_oso_plugin_app().messagesToSign(messages_request)
         )
 
-        logger.debug(
-            f"messagesToSign response object: {model_dump(messages_status_response)}"
-        )
+        response = model_response(messages_status_response)
 
-        return jsonify(model_dump(messages_status_response))
+        logger.debug("messagesToSign response object: %r", Lazy(response.get_data))
+
+        return response
 
 
 class CustomerServerMessagesStatusApi(MethodView):
@@ -65,19 +65,29 @@ class CustomerServerMessagesStatusApi(MethodView):
     ENDPOINT = "/".join(__name__.split(".")[-2:])
 
     def post(self):
-        json_data = request.get_json()
+        raw_data = request.get_data()
 
         try:
-            messages_status_request = MessagesStatusRequest.model_validate(json_data)
+            messages_status_request = MessagesStatusRequest.model_validate_json(
+                raw_data
+            )
 
         except Exception as e:
             logger.error("Could not validate MessagesStatusRequest")
-            logger.debug(f"Request: {json_data}, Error: {e}")
+            logger.debug("Request: %r, Error: %s", raw_data, e)
             raise ValidationError("Could not validate MessagesStatusRequest")
 
+        # Optional long-poll, in seconds. It holds this worker until a request
+        # is signed, which takes a to_isv call served by another worker, so it
+        # is only honoured when the server handles requests concurrently
+        wait = None
+
+        if request.environ.get("wsgi.multithread"):
+            wait = request.args.get("wait", type=float)
+
         # You don't really get type checking from current_oso_plugin
         messages_status_response: MessagesStatusResponse = (
-            current_oso_plugin_app().messagesStatus(messages_status_request)
+            current_oso_plugin_app().messagesStatus(messages_status_request, wait)
         )
 
-        return jsonify(model_dump(messages_status_response))
+        return model_response(messages_status_response)
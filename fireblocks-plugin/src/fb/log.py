@@ -0,0 +1,113 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+""""""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+
+from typing import Any, Callable, Optional
+
+import pydantic
+
+from .utils import model_dump_json
+
+
+# Fraction of payload log arguments that are rendered, see :class:`Payload`
+payload_sample_rate = 1.0
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class Lazy:
+    """Log argument formatted as ``fn(*args)`` only if the record is emitted.
+
+    Pass it as a ``%s`` or ``%r`` argument, e.g.
+    ``logger.debug("status: %s", Lazy(store.stats))``.
+    """
+
+    __slots__ = ("fn", "args")
+
+    def __init__(self, fn: Callable[..., Any], *args: Any) -> None:
+        self.fn = fn
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.fn(*self.args))
+
+    def __repr__(self) -> str:
+        return repr(self.fn(*self.args))
+
+
+class Payload:
+    """Log argument dumping ``model`` as JSON only if the record is emitted.
+
+    Only ``payload_sample_rate`` of the payloads are dumped, the others are
+    logged as a placeholder.
+    """
+
+    __slots__ = ("model", "sampled")
+
+    def __init__(self, model: pydantic.BaseModel) -> None:
+        self.model = model
+        self.sampled = payload_sample_rate >= 1 or random.random() < payload_sample_rate
+
+    def __str__(self) -> str:
+        if not self.sampled:
+            return f"<{type(self.model).__name__} not sampled>"
+
+        return model_dump_json(self.model)
+
+
+def configure_logging(level: str | int, sample_rate: float = 1.0) -> None:
+    """Set the level of the ``fb`` loggers and where their records go.
+
+    Unless the application already configured the root logger, records are
+    handed to a queue and written to stdout by a background thread, so a
+    request never waits for the write.
+    """
+    global payload_sample_rate, _listener
+
+    payload_sample_rate = sample_rate
+    logging.getLogger(__package__).setLevel(level)
+
+    root = logging.getLogger()
+
+    if _listener is not None or root.handlers:
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(records)
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(records, handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    def restart_in_child() -> None:
+        # The writer thread doesn't survive a fork
+        assert _listener is not None
+        queue_handler.queue = _listener.queue = queue.SimpleQueue()
+        _listener.start()
+
+    os.register_at_fork(after_in_child=restart_in_child)
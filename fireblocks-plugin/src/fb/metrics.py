@@ -0,0 +1,336 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+""""""
+
+import abc
+import bisect
+import threading
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from flask import Response
+from flask.views import MethodView
+
+from oso.framework.plugin import current_oso_plugin_app
+
+
+Labels = Tuple[str, ...]
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+BATCH_BUCKETS = (1, 10, 100, 1000, 10000)
+
+
+def format_labels(names: Sequence[str], values: Labels) -> str:
+    if not names:
+        return ""
+
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in zip(names, values)
+    )
+
+    return f"{{{pairs}}}"
+
+
+class Metric(abc.ABC):
+    TYPE = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+        # Every thread records into its own shard so recording never takes a
+        # lock; shards are only merged when scraped
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, Dict[Labels, Any]]] = []
+        # Folded shards of finished threads
+        self._retired: Dict[Labels, Any] = {}
+        self._lock = threading.Lock()
+
+    def shard(self) -> Dict[Labels, Any]:
+        try:
+            return self._local.shard
+
+        except AttributeError:
+            shard = self._local.shard = {}
+
+            with self._lock:
+                self._shards.append((threading.current_thread(), shard))
+
+            return shard
+
+    def collect(self) -> Dict[Labels, Any]:
+        """Values per label set, merged across threads."""
+        with self._lock:
+            live = []
+
+            for thread, shard in self._shards:
+                if thread.is_alive():
+                    live.append((thread, shard))
+
+                else:
+                    self._merge(self._retired, shard)
+
+            self._shards = live
+
+            values = dict(self._retired)
+
+            for _, shard in live:
+                self._merge(values, shard)
+
+        return values
+
+    def _merge(self, into: Dict[Labels, Any], shard: Dict[Labels, Any]) -> None:
+        for labels, value in dict(shard).items():
+            current = into.get(labels)
+            into[labels] = value if current is None else self.add(current, value)
+
+    def add(self, a: Any, b: Any) -> Any:
+        return a + b
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.TYPE}",
+        ]
+
+    @abc.abstractmethod
+    def render(self) -> List[str]: ...
+
+
+class Counter(Metric):
+    TYPE = "counter"
+
+    def inc(self, amount: float = 1, labels: Labels = ()) -> None:
+        shard = self.shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self.collect().get(labels, 0)
+
+    def render(self) -> List[str]:
+        return self.header() + [
+            f"{self.name}{format_labels(self.labelnames, labels)} {value}"
+            for labels, value in self.collect().items()
+        ]
+
+
+class Gauge(Metric):
+    """Gauge read from ``fn`` at scrape time, so it costs nothing in between."""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, fn: Callable[[], float]) -> None:
+        super().__init__(name, documentation)
+        self.fn = fn
+
+    def render(self) -> List[str]:
+        return self.header() + [f"{self.name} {self.fn()}"]
+
+
+class ScrapedCounter(Metric):
+    """Counter read from ``fn`` at scrape time, for totals kept elsewhere."""
+
+    TYPE = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        fn: Callable[[], Dict[Labels, float]],
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.fn = fn
+
+    def render(self) -> List[str]:
+        return self.header() + [
+            f"{self.name}{format_labels(self.labelnames, labels)} {value}"
+            for labels, value in self.fn().items()
+        ]
+
+
+class Histogram(Metric):
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        shard = self.shard()
+        # Per-bucket counts (the last one is +Inf), then the sum
+        series = shard.get(labels)
+
+        if series is None:
+            series = shard[labels] = [0] * (len(self.buckets) + 2)
+
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def add(self, a: List[float], b: List[float]) -> List[float]:
+        return [x + y for x, y in zip(a, b)]
+
+    def count(self, labels: Labels = ()) -> int:
+        series = self.collect().get(labels)
+        return int(sum(series[:-1])) if series is not None else 0
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        labelnames = self.labelnames + ("le",)
+
+        for labels, series in self.collect().items():
+            cumulative = 0
+
+            for bound, count in zip([*self.buckets, "+Inf"], series[:-1]):
+                cumulative += int(count)
+                lines.append(
+                    f"{self.name}_bucket"
+                    f"{format_labels(labelnames, labels + (str(bound),))} {cumulative}"
+                )
+
+            label_str = format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {series[-1]}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+
+        return lines
+
+
+class Registry:
+    """Metrics rendered together in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self.metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def gauge(self, name: str, documentation: str, fn: Callable[[], float]) -> Gauge:
+        metric = Gauge(name, documentation, fn)
+        self.register(metric)
+        return metric
+
+    def scraped_counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        fn: Callable[[], Dict[Labels, float]],
+    ) -> ScrapedCounter:
+        metric = ScrapedCounter(name, documentation, labelnames, fn)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.register(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+
+        for metric in self.metrics:
+            lines.extend(metric.render())
+
+        return "\n".join(lines) + "\n"
+
+
+class PluginMetrics(Registry):
+    """Metrics recorded by ``FBPlugin``; store gauges are added by the plugin."""
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.sign_seconds = self.histogram(
+            "fb_sign_seconds",
+            "Time to sign one envelope.",
+            ["algorithm"],
+        )
+        self.sign_failures = self.counter(
+            "fb_sign_failures_total",
+            "Messages the signing server failed to sign.",
+            ["algorithm"],
+        )
+        self.to_oso_documents = self.counter(
+            "fb_to_oso_documents_total",
+            "Documents handed to OSO.",
+        )
+        self.to_oso_batch_documents = self.histogram(
+            "fb_to_oso_batch_documents",
+            "Documents per to_oso batch.",
+            buckets=BATCH_BUCKETS,
+        )
+        self.to_isv_documents = self.counter(
+            "fb_to_isv_documents_total",
+            "Documents received from OSO.",
+        )
+        self.to_isv_failures = self.counter(
+            "fb_to_isv_failures_total",
+            "Documents received from OSO that could not be processed.",
+        )
+
+
+class MetricsApi(MethodView):
+    """Prometheus text exposition of the plugin metrics."""
+
+    ENDPOINT = "/".join(__name__.split(".")[-2:])
+
+    def get(self):
+        return Response(
+            current_oso_plugin_app().metrics.render(),
+            mimetype="text/plain; version=0.0.4",
+        )
@@ -15,24 +15,49 @@
 #
 """"""
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
 
-import sys
 import json
 import logging
-
-from typing import List, cast, Literal
+import threading
+import time
+
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+    Literal,
+)
+from uuid import UUID
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from werkzeug.exceptions import NotFound
+from flask import Flask, current_app
+from werkzeug.exceptions import NotFound, RequestEntityTooLarge, TooManyRequests
 
 from oso.framework.data.types import V1_3
 from oso.framework.plugin.base import PluginProtocol
-from oso.framework.plugin import current_oso_plugin, current_oso_plugin_app
+from oso.framework.plugin import current_oso_plugin
 from oso.framework.plugin.addons.signing_server import SigningServerAddon, KeyType
 
 
+from .codec import ContentEncoding, decode_content, encode_content
+from .log import Lazy, Payload, configure_logging
+from .metrics import Labels, MetricsApi, PluginMetrics
+from .resilience import CircuitBreaker, ResilientSigningServer
+from .store import (
+    RequestStore,
+    SQLiteJournal,
+    SQLiteRequestStore,
+    Store,
+    StoreJournal,
+)
 from .utils import log_error, model_dump_json
 
 from .customer_server import (
@@ -47,63 +72,259 @@ from .types import (
     MessagesStatusResponse,
     MessageStatus,
     MessagesStatusRequest,
+    MessageToSign,
     MessagesRequest,
+    QueuedEnvelope,
     RequestType,
     ResponseType,
     SignedMessage,
 )
 
 
-logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T", MessageEnvelope, MessageStatus, QueuedEnvelope)
+
 
 class FBPlugin(PluginProtocol):
     class Config(BaseSettings):
         hot_mode: bool = False
+        hot_mode_async: bool = False
+        hot_mode_workers: int = 4
+        hot_queue_max: int = 1000
+        signing_recovery_successes: int = 10
+        signing_deadline: float = 30
+        signing_retries: int = 2
+        signing_backoff: float = 0.1
+        signing_backoff_max: float = 2
+        breaker_failure_threshold: int = 5
+        breaker_reset_timeout: float = 30
+        breaker_slow_call: float = 5
+        health_check_ttl: float = 5
         min_keys: int = 1
+        sign_concurrency: int = 8
+        pipeline_in_flight: int = 4
+        # "sqlite" journals a single worker's state; use "shared" with more
+        # than one worker, see SQLiteJournal
+        store_backend: Literal["memory", "sqlite", "shared"] = "memory"
+        store_path: str = "fb-store.sqlite3"
+        signed_ttl: Optional[float] = 24 * 60 * 60
+        signed_max_bytes: Optional[int] = 256 * 1024 * 1024
+        # Admission control on queued requests, see FBPlugin.admit()
+        pending_high_watermark: int = 10000
+        pending_low_watermark: int = 8000
+        pending_high_watermark_bytes: int = 256 * 1024 * 1024
+        pending_low_watermark_bytes: int = 192 * 1024 * 1024
+        overload_retry_after: int = 5
+        to_oso_max_documents: int = 1000
+        to_oso_max_bytes: int = 16 * 1024 * 1024
+        content_encoding: ContentEncoding = "identity"
+        # messagesStatus long-polls need the ASGI front or a threaded worker
+        # (e.g. gunicorn gthread), other WSGI servers ignore ``wait``
+        status_max_wait: float = 30
+        status_poll_interval: float = 0.5
+        log_level: str = "INFO"
+        log_payload_sample_rate: float = 1.0
         model_config = SettingsConfigDict(env_prefix="FB__")
 
     internalViews = {
         "messagesToSign": CustomerServerMessagesToSignApi(),
         "messagesStatus": CustomerServerMessagesStatusApi(),
+        "metrics": MetricsApi(),
     }
 
     def __init__(self) -> None:
         super().__init__()
         self.config = self.Config()
+        configure_logging(self.config.log_level, self.config.log_payload_sample_rate)
         self.signing_error = None
+        # Successful signatures since the last failure
+        self.signing_successes = 0
+        self.signing_lock = threading.Lock()
+
+        # (probe time, result) of the last signing server health check
+        self.health_cache: Optional[Tuple[float, V1_3.ComponentStatus]] = None
+        self.health_lock = threading.Lock()
+
+        self.metrics = PluginMetrics()
+        self.metrics.gauge(
+            "fb_pending_messages",
+            "Requests waiting to be shipped to the backend.",
+            lambda: len(self.pending_messages),
+        )
+        self.metrics.gauge(
+            "fb_in_flight_messages",
+            "Requests being signed.",
+            lambda: len(self.in_flight),
+        )
+        self.metrics.gauge(
+            "fb_signed_statuses",
+            "Signed statuses waiting to be picked up.",
+            lambda: len(self.signed_statuses),
+        )
+        self.metrics.gauge(
+            "fb_signed_statuses_bytes",
+            "Encoded size of the signed statuses waiting to be picked up.",
+            lambda: self.signed_statuses.stats()["bytes"],
+        )
+        self.metrics.scraped_counter(
+            "fb_signed_statuses_evicted_total",
+            "Signed statuses dropped before they were picked up.",
+            ["reason"],
+            lambda: self.eviction_stats("evicted"),
+        )
+        self.metrics.scraped_counter(
+            "fb_signed_statuses_evicted_bytes_total",
+            "Encoded size of the signed statuses dropped before pick up.",
+            ["reason"],
+            lambda: self.eviction_stats("evicted_bytes"),
+        )
+        self.metrics.gauge(
+            "fb_overloaded",
+            "1 while new requests are rejected above the high watermark.",
+            lambda: int(self.overloaded),
+        )
+        self.metrics.gauge(
+            "fb_hot_queue_depth",
+            "Envelopes queued for asynchronous hot mode signing.",
+            lambda: self.hot_queue_depth,
+        )
+
+        self.warmup_state: Literal["pending", "running", "ready", "failed"] = "pending"
+        self.warmup_thread: Optional[threading.Thread] = None
+        self.warmup_lock = threading.Lock()
+
+        self.journal: Optional[StoreJournal] = None
+
+        if self.config.store_backend == "sqlite":
+            self.journal = SQLiteJournal(self.config.store_path)
 
-        self.signed_statuses: List[MessageStatus] = []
-        self.pending_messages: List[MessageEnvelope] = []
+        # Limits only apply where the frontend calls evict()
+        self.signed_statuses: Store[MessageStatus] = self.make_store(
+            "signed",
+            MessageStatus,
+            ttl=self.config.signed_ttl,
+            max_bytes=self.config.signed_max_bytes,
+        )
+        self.pending_messages: Store[QueuedEnvelope] = self.make_store(
+            "pending", QueuedEnvelope
+        )
+
+        # Frontend bookkeeping so retried requests are never signed twice:
+        # requests shipped to the backend that have no result yet, and results
+        # already handed to the agent (or signed inline in hot mode)
+        self.in_flight: Store[MessageStatus] = self.make_store(
+            "in_flight",
+            MessageStatus,
+            ttl=self.config.signed_ttl,
+        )
+        self.claimed_statuses: Store[MessageStatus] = self.make_store(
+            "claimed",
+            MessageStatus,
+            ttl=self.config.signed_ttl,
+            max_bytes=self.config.signed_max_bytes,
+        )
+
+        # Notified whenever new signed statuses land, for long-polling agents;
+        # listeners are called too, e.g. to wake an event loop
+        self.signed_condition = threading.Condition()
+        self.signed_listeners: set[Callable[[], None]] = set()
+
+        # Set above the high watermark of queued requests, cleared below the
+        # low watermark
+        self.overloaded = False
+        self.admission_lock = threading.Lock()
+
+        # Envelopes accepted in asynchronous hot mode and not yet signed
+        self.hot_queue_depth = 0
+        self.hot_queue_lock = threading.Lock()
+
+    def make_store(
+        self,
+        name: str,
+        model: type[MessageStatus] | type[QueuedEnvelope],
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Store:
+        """Request store for the configured ``store_backend``.
+
+        ``shared`` keeps the state in the SQLite database at ``store_path``, so
+        every gunicorn worker of the frontend sees the same requests.
+        """
+        if self.config.store_backend == "shared":
+            return SQLiteRequestStore(
+                self.config.store_path, name, model, ttl=ttl, max_bytes=max_bytes
+            )
+
+        return RequestStore(name, model, self.journal, ttl=ttl, max_bytes=max_bytes)
 
     @cached_property
-    def signing_server(self) -> SigningServerAddon:
-        signing_server = cast(
-            SigningServerAddon, current_oso_plugin().addons["SigningServer"]
+    def signing_server(self) -> ResilientSigningServer:
+        addon = cast(SigningServerAddon, current_oso_plugin().addons["SigningServer"])
+
+        return ResilientSigningServer(
+            addon,
+            CircuitBreaker(
+                failure_threshold=self.config.breaker_failure_threshold,
+                reset_timeout=self.config.breaker_reset_timeout,
+                slow_call_threshold=self.config.breaker_slow_call,
+            ),
+            deadline=self.config.signing_deadline,
+            retries=self.config.signing_retries,
+            backoff=self.config.signing_backoff,
+            backoff_max=self.config.signing_backoff_max,
+            max_workers=4 * self.config.sign_concurrency,
         )
 
-        all_keys_info = []
+    def start_warmup(self) -> threading.Thread:
+        """Provision the key pool in the background, once.
+
+        A failed warmup is retried on the next call.
+        """
+        with self.warmup_lock:
+            if self.warmup_state in ("pending", "failed"):
+                app = current_app._get_current_object()
+
+                self.warmup_state = "running"
+                self.warmup_thread = threading.Thread(
+                    target=self.warmup,
+                    args=(app,),
+                    name="fb-warmup",
+                    daemon=True,
+                )
+                self.warmup_thread.start()
 
-        for key_type in KeyType:
+            assert self.warmup_thread is not None
+            return self.warmup_thread
+
+    def warmup(self, app: Flask) -> None:
+        with app.app_context():
             try:
-                keys = signing_server.list_keys(key_type)
+                self.provision_keys()
 
             except Exception as e:
-                logger.info("Error listing keys")
-                logger.debug(f"Error: {e}")
+                logger.error("Key pool warmup failed")
+                logger.debug("Error: %s", e)
+                self.warmup_state = "failed"
 
-            needed_keys = current_oso_plugin_app().Config().min_keys - len(keys)
+            else:
+                logger.info("Key pool warmup done")
+                self.warmup_state = "ready"
 
-            for _ in range(needed_keys):
-                try:
-                    key_id, pub_key_pem = signing_server.generate_key_pair(key_type)
+    def provision_keys(self) -> None:
+        """Generate keys until every ``KeyType`` has at least ``min_keys``."""
+        signing_server = self.signing_server
+
+        def provision(key_type: KeyType) -> list[dict[str, str]]:
+            keys_info = []
+
+            keys = signing_server.list_keys(key_type)
+            needed_keys = self.config.min_keys - len(keys)
 
-                except Exception as e:
-                    logger.info("Error generating keys")
-                    logger.debug(f"Error: {e}")
+            for _ in range(needed_keys):
+                key_id, pub_key_pem = signing_server.generate_key_pair(key_type)
 
-                all_keys_info.append(
+                keys_info.append(
                     {
                         "key_type": key_type.name,
                         "key_id": key_id,
@@ -111,9 +332,69 @@ class FBPlugin(PluginProtocol):
                     }
                 )
 
-        logger.info(f"Generated Keys: '{json.dumps(all_keys_info)}'")
+            return keys_info
+
+        all_keys_info = []
+
+        # Key types are independent, provision them in parallel
+        with ThreadPoolExecutor(
+            max_workers=len(KeyType), thread_name_prefix="fb-keygen"
+        ) as executor:
+            for keys_info in executor.map(provision, KeyType):
+                all_keys_info.extend(keys_info)
+
+        logger.info("Generated Keys: '%s'", Lazy(json.dumps, all_keys_info))
+
+    def warmup_status(self) -> Optional[V1_3.ComponentStatus]:
+        """Not-ready status while the key pool is being provisioned."""
+        if self.warmup_state == "ready":
+            return None
+
+        self.start_warmup()
+
+        match self.warmup_state:
+            case "ready":
+                return None
+
+            case "failed":
+                return V1_3.ComponentStatus(
+                    status_code=500,
+                    status="ERROR",
+                    errors=[
+                        V1_3.Error(
+                            code="KEY-WARMUP-FAILED",
+                            message="Failed to provision the signing key pool",
+                        )
+                    ],
+                )
+
+            case _:
+                return V1_3.ComponentStatus(
+                    status_code=503,
+                    status="Provisioning signing keys",
+                    errors=[],
+                )
 
-        return signing_server
+    @cached_property
+    def sign_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.config.sign_concurrency,
+            thread_name_prefix="fb-sign",
+        )
+
+    @cached_property
+    def document_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.config.pipeline_in_flight,
+            thread_name_prefix="fb-document",
+        )
+
+    @cached_property
+    def hot_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.config.hot_mode_workers,
+            thread_name_prefix="fb-hot-sign",
+        )
 
     @cached_property
     def mode(self) -> Literal["frontend", "backend"]:
@@ -122,39 +403,57 @@ class FBPlugin(PluginProtocol):
     def messagesToSign(
         self, messages_request: MessagesRequest
     ) -> MessagesStatusResponse:
-        logger.debug(
-            f"Entering messagesToSign() with '{model_dump_json(messages_request)}'"
-        )
+        logger.debug("Entering messagesToSign() with '%s'", Payload(messages_request))
 
         messages_status_response = MessagesStatusResponse(statuses=[])
 
         match current_oso_plugin().config.mode:
             case "frontend":
+                # HOT mode (non-OSO), acknowledged now and signed in the background
+                if self.config.hot_mode and self.config.hot_mode_async:
+                    messages_status_response.statuses = self.sign_in_background(
+                        messages_request
+                    )
+
                 # HOT mode (non-OSO) -> sign the messages now
-                if self.config.hot_mode:
+                elif self.config.hot_mode:
                     for message in messages_request.messages:
-                        messages_status_response.statuses.append(self.sign(message))
+                        messages_status_response.statuses.append(self.hot_sign(message))
+
+                    self.claimed_statuses.evict()
 
                 else:
+                    new_messages: dict[UUID, QueuedEnvelope] = {}
+
                     for message in messages_request.messages:
-                        self.pending_messages.append(message)
+                        request_id = message.transportMetadata.requestId
+                        message_status = self.known_status(request_id)
 
-                        response_type = infer_response_type(
-                            message.transportMetadata.request_type
-                        )
-                        # Because the message hasn't been signed,
-                        # there is no signedMessages/MessageResponse
-                        message_response = MessageResponse()
-
-                        message_status = MessageStatus(
-                            response_type=response_type,
-                            status=MessageState.PENDING_SIGN,
-                            requestId=message.transportMetadata.requestId,
-                            response=message_response,
-                        )
+                        # Retried request, report where it is instead of re-queuing
+                        if message_status is None:
+                            # Only the compact form is queued
+                            if request_id not in new_messages:
+                                new_messages[request_id] = QueuedEnvelope.from_envelope(
+                                    message
+                                )
+
+                            message_status = pending_status(message)
 
                         messages_status_response.statuses.append(message_status)
 
+                    self.admit(
+                        len(new_messages),
+                        sum(len(queued.data) for queued in new_messages.values()),
+                    )
+
+                    for request_id, queued in new_messages.items():
+                        self.pending_messages.put(
+                            request_id, queued, size=len(queued.data)
+                        )
+
+                    # Don't acknowledge anything that would not survive a restart
+                    self.pending_messages.flush()
+
             case "backend":
                 log_error(
                     logger=logger,
@@ -163,18 +462,22 @@ class FBPlugin(PluginProtocol):
                     error_type=NotFound,
                 )
 
-        logger.debug(
-            f"messagesToSign returning {model_dump_json(messages_status_response)}",
-        )
+        logger.debug("messagesToSign returning %s", Payload(messages_status_response))
 
         return messages_status_response
 
     def messagesStatus(
-        self, messages_status_request: MessagesStatusRequest
+        self,
+        messages_status_request: MessagesStatusRequest,
+        wait: Optional[float] = None,
     ) -> MessagesStatusResponse:
+        """Report the state of the requested ids.
+
+        With ``wait`` (seconds, capped at ``status_max_wait``) the call blocks
+        until one of the requests still being signed is signed, or it times out.
+        """
         logger.debug(
-            "Entering messagesStatus() with"
-            f" {model_dump_json(messages_status_request)}",
+            "Entering messagesStatus() with %s", Payload(messages_status_request)
         )
 
         if current_oso_plugin().config.mode != "frontend":
@@ -185,41 +488,37 @@ class FBPlugin(PluginProtocol):
                 error_type=NotFound,
             )
 
+        self.evict_unclaimed()
+
         messages_status_response = MessagesStatusResponse(statuses=[])
 
-        for message in self.pending_messages:
-            if (
-                message.transportMetadata.requestId
-                in messages_status_request.requestsIds
-            ):
-                response_type = infer_response_type(
-                    message.transportMetadata.request_type
-                )
-                message_response = MessageResponse()
+        # De-duplicate while keeping the order the agent asked in
+        request_ids = dict.fromkeys(messages_status_request.requestsIds)
 
-                message_status = MessageStatus(
-                    response_type=response_type,
-                    status=MessageState.PENDING_SIGN,
-                    requestId=message.transportMetadata.requestId,
-                    response=message_response,
-                )
+        if wait is not None and wait > 0:
+            self.wait_for_signed(request_ids, min(wait, self.config.status_max_wait))
 
-                messages_status_response.statuses.append(message_status)
+        for request_id in request_ids:
+            message = self.pending_messages.get(request_id)
+
+            if message is not None:
+                messages_status_response.statuses.append(pending_status(message))
+                continue
 
-        updated_signed_statuses: List[MessageStatus] = []
+            message_status = self.in_flight.get(request_id)
 
-        for message_status in self.signed_statuses:
-            if message_status.requestId in messages_status_request.requestsIds:
+            if message_status is not None:
                 messages_status_response.statuses.append(message_status)
 
-            else:
-                updated_signed_statuses.append(message_status)
+        # Signed statuses are handed over exactly once
+        for request_id in request_ids:
+            message_status = self.signed_statuses.pop(request_id)
 
-        self.signed_statuses = updated_signed_statuses
+            if message_status is not None:
+                self.claimed_statuses.put(request_id, message_status)
+                messages_status_response.statuses.append(message_status)
 
-        logger.debug(
-            f"messagesStatus returning {model_dump_json(messages_status_response)}",
-        )
+        logger.debug("messagesStatus returning %s", Payload(messages_status_response))
 
         return messages_status_response
 
@@ -227,88 +526,462 @@ class FBPlugin(PluginProtocol):
         logger.debug("Entering to_oso()")
 
         docs: list[V1_3.Document] = []
+        remaining = 0
 
         match self.mode:
             case "frontend":
-                logger.debug(f"to_oso: {self.pending_messages=}")
+                logger.debug("to_oso: self.pending_messages=%r", self.pending_messages)
 
-                for message in self.pending_messages:
+                for request_id, message, content in self.next_batch(
+                    self.pending_messages, self.in_flight
+                ):
                     document = V1_3.Document(
-                        id=str(message.transportMetadata.requestId),
-                        content=model_dump_json(message),
+                        id=str(request_id),
+                        content=content,
                         metadata="",
                     )
 
                     docs.append(document)
 
-                self.pending_messages.clear()
+                remaining = len(self.pending_messages)
 
             case "backend":
-                logger.debug(f"to_oso: {self.signed_statuses=}")
+                logger.debug("to_oso: self.signed_statuses=%r", self.signed_statuses)
 
-                for message_status in self.signed_statuses:
+                for request_id, _, content in self.next_batch(self.signed_statuses):
                     document = V1_3.Document(
-                        id=str(message_status.requestId),
-                        content=model_dump_json(message_status),
+                        id=str(request_id),
+                        content=content,
                         metadata="",
                     )
 
                     docs.append(document)
 
-                self.signed_statuses.clear()
+                remaining = len(self.signed_statuses)
+
+        self.metrics.to_oso_documents.inc(len(docs))
+        self.metrics.to_oso_batch_documents.observe(len(docs))
+
+        if remaining:
+            logger.info("to_oso: %d requests left for the next cycle", remaining)
 
-        logger.debug(f"to_oso() returning: {docs=}")
+        # Popped requests must not come back as pending after a restart, the
+        # journal is shared so this covers every store
+        self.pending_messages.flush()
+
+        logger.debug("to_oso() returning: docs=%r", docs)
 
         return V1_3.DocumentList(documents=docs, count=len(docs))
 
     def to_isv(self, oso: V1_3.DocumentList) -> list[str]:
-        logger.debug(f"entering to_isv: {oso=}")
+        logger.debug("entering to_isv: oso=%r", oso)
+
+        self.metrics.to_isv_documents.inc(len(oso.documents))
 
         match self.mode:
             case "frontend":
                 for doc in oso.documents:
                     try:
-                        message_status = MessageStatus.model_validate_json(doc.content)
+                        content = decode_content(doc.content)
+                        message_status = MessageStatus.model_validate_json(content)
 
                     except Exception as e:
                         logger.error("ERROR: could not validate message")
-                        logger.debug(f"Invalid doc: {doc=}, Error {e}")
+                        logger.debug("Invalid doc: doc=%r, Error %s", doc, e)
+                        self.metrics.to_isv_failures.inc()
                         continue
 
-                    self.signed_statuses.append(message_status)
+                    # Signed before leaving in_flight, so the request is never
+                    # unknown to a retry
+                    self.signed_statuses.put(
+                        message_status.requestId,
+                        message_status,
+                        size=len(content),
+                    )
+                    self.in_flight.pop(message_status.requestId)
+
+                self.evict_unclaimed()
+                self.signed_statuses.flush()
+                self.notify_signed()
 
             case "backend":
-                for doc in oso.documents:
-                    try:
-                        message_envelope = MessageEnvelope.model_validate_json(
-                            doc.content
-                        )
+                # Provision keys off the signing path, and resolve the addon
+                # once before fanning out
+                self.start_warmup()
+                self.signing_server
+
+                if self.config.pipeline_in_flight > 1 and len(oso.documents) > 1:
+                    message_statuses = self.document_executor.map(
+                        self.validate_and_sign, oso.documents
+                    )
 
-                    except Exception as e:
-                        logger.error("ERROR: could not validate message")
-                        logger.debug(f"Invalid doc: {doc=}, Error {e}")
-                        continue
+                else:
+                    message_statuses = map(self.validate_and_sign, oso.documents)
 
-                    message_status = self.sign(message_envelope)
+                # Results are yielded in document order as soon as each is ready
+                for message_status in message_statuses:
+                    if message_status is None:
+                        self.metrics.to_isv_failures.inc()
+                        continue
 
                     logger.debug(
-                        "Appending signed message status:"
-                        f" {model_dump_json(message_status)}"
+                        "Appending signed message status: %s", Payload(message_status)
                     )
 
-                    self.signed_statuses.append(message_status)
+                    self.signed_statuses.put(message_status.requestId, message_status)
+
+                self.signed_statuses.flush()
 
         return ["OK"]
 
+    def next_batch(
+        self, store: Store[T], in_flight: Optional[Store[MessageStatus]] = None
+    ) -> List[Tuple[UUID, T, str]]:
+        """Pop the oldest items of ``store`` that fit in one ``to_oso`` batch.
+
+        The first item is always taken, even if it alone exceeds the byte limit,
+        so an oversized request can't block the queue. Popped items are first
+        put in ``in_flight``, if given.
+        """
+        batch: List[Tuple[UUID, T, str]] = []
+        total_bytes = 0
+
+        for request_id, item in store.peek(self.config.to_oso_max_documents):
+            content = encode_content(
+                model_dump_json(item), self.config.content_encoding
+            )
+
+            if batch and total_bytes + len(content) > self.config.to_oso_max_bytes:
+                break
+
+            # In flight before leaving the store, so the request is never
+            # unknown to a retry
+            claimed = False
+
+            if in_flight is not None:
+                claimed = request_id not in in_flight
+                in_flight.put(request_id, pending_status(cast(QueuedEnvelope, item)))
+
+            if store.pop(request_id) is None:
+                # Taken by another worker
+                if in_flight is not None and claimed:
+                    in_flight.pop(request_id)
+
+                continue
+
+            batch.append((request_id, item, content))
+            total_bytes += len(content)
+
+        return batch
+
+    def queue_usage(self) -> Tuple[int, int]:
+        """Requests and bytes queued on the frontend and not yet signed."""
+        pending_stats = self.pending_messages.stats()
+
+        return (
+            pending_stats["entries"] + len(self.in_flight),
+            pending_stats["bytes"],
+        )
+
+    def update_overloaded(self, requests: int, queued_bytes: int) -> bool:
+        """Update the overload state from the queue usage, and return it.
+
+        Requests are rejected from the moment either high watermark is
+        reached until both usages are back under their low watermark.
+        """
+        config = self.config
+
+        with self.admission_lock:
+            if self.overloaded:
+                if (
+                    requests < config.pending_low_watermark
+                    and queued_bytes < config.pending_low_watermark_bytes
+                ):
+                    logger.info("Queue drained below the low watermark")
+                    self.overloaded = False
+
+            elif (
+                requests >= config.pending_high_watermark
+                or queued_bytes >= config.pending_high_watermark_bytes
+            ):
+                logger.warning(
+                    "Queue reached the high watermark, rejecting new requests"
+                )
+                self.overloaded = True
+
+            return self.overloaded
+
+    def admit(self, messages: int, size: int = 0) -> None:
+        """Raise unless ``messages`` new requests of ``size`` bytes fit.
+
+        A request bigger than a high watermark on its own never fits, and is
+        rejected with 413. Otherwise it is rejected with 429 and
+        ``Retry-After`` while the frontend is overloaded, or when it would take
+        the queue past a high watermark.
+        """
+        if (
+            messages > self.config.pending_high_watermark
+            or size > self.config.pending_high_watermark_bytes
+        ):
+            log_error(
+                logger=logger,
+                msg="Request is larger than the queue high watermark",
+                debug_msg=f"New requests: {messages}, bytes: {size}",
+                error_type=RequestEntityTooLarge,
+            )
+
+        requests, queued_bytes = self.queue_usage()
+
+        if self.update_overloaded(requests, queued_bytes):
+            self.too_many_requests(
+                "Too many requests queued",
+                f"Queued requests: {requests}, bytes: {queued_bytes}",
+            )
+
+        if (
+            requests + messages > self.config.pending_high_watermark
+            or queued_bytes + size > self.config.pending_high_watermark_bytes
+        ):
+            self.too_many_requests(
+                "Request would take the queue past the high watermark",
+                f"Queued requests: {requests}, bytes: {queued_bytes},"
+                f" new requests: {messages}, bytes: {size}",
+            )
+
+    def too_many_requests(self, msg: str, debug_msg: str) -> NoReturn:
+        """Reject the request with 429, the agent retries it later."""
+        logger.error(msg)
+        logger.debug(debug_msg)
+
+        raise TooManyRequests(msg, retry_after=self.config.overload_retry_after)
+
+    def sign_in_background(
+        self, messages_request: MessagesRequest
+    ) -> List[MessageStatus]:
+        """Queue new envelopes on the hot mode pool and report them pending.
+
+        The whole request is rejected when it would take the queue past
+        ``hot_queue_max``, so the agent retries it later.
+        """
+        statuses: List[MessageStatus] = []
+        new_messages: dict[UUID, MessageEnvelope] = {}
+
+        # Requests are claimed in in_flight under the lock, so concurrent
+        # retries of a request can't both queue it
+        with self.hot_queue_lock:
+            for message in messages_request.messages:
+                request_id = message.transportMetadata.requestId
+                message_status = self.known_status(request_id)
+
+                if message_status is None:
+                    new_messages.setdefault(request_id, message)
+                    message_status = pending_status(message)
+
+                statuses.append(message_status)
+
+            if self.hot_queue_depth + len(new_messages) > self.config.hot_queue_max:
+                self.too_many_requests(
+                    "Too many messages waiting to be signed",
+                    f"Queue depth: {self.hot_queue_depth},"
+                    f" new messages: {len(new_messages)}",
+                )
+
+            self.admit(len(new_messages))
+
+            self.hot_queue_depth += len(new_messages)
+
+            for request_id, message in new_messages.items():
+                self.in_flight.put(request_id, pending_status(message))
+
+        app = current_app._get_current_object()
+
+        for message in new_messages.values():
+            self.hot_executor.submit(self.sign_in_app, app, message)
+
+        return statuses
+
+    def sign_in_app(self, app: Flask, message: MessageEnvelope) -> None:
+        request_id = message.transportMetadata.requestId
+
+        with app.app_context():
+            try:
+                message_status = self.sign(message)
+
+            except Exception as e:
+                logger.error("Could not sign message")
+                logger.debug("Request: %s, Error: %s", request_id, e)
+
+                message_status = pending_status(message)
+                message_status.status = MessageState.FAILED
+                message_status.response.errorMessage = "Could not sign message"
+
+            with self.hot_queue_lock:
+                self.hot_queue_depth -= 1
+
+            # Signed before leaving in_flight, so the request is never unknown
+            self.signed_statuses.put(request_id, message_status)
+            self.in_flight.pop(request_id)
+            self.signed_statuses.flush()
+
+        self.notify_signed()
+
+    def hot_sign(self, message: MessageEnvelope) -> MessageStatus:
+        """Sign ``message`` now, unless its request was seen before."""
+        message_status = self.known_status(message.transportMetadata.requestId)
+
+        if message_status is None:
+            message_status = self.sign(message)
+            self.claimed_statuses.put(message_status.requestId, message_status)
+
+        return message_status
+
+    def known_status(self, request_id: UUID) -> Optional[MessageStatus]:
+        """Current frontend state of ``request_id``, if it was seen before."""
+        for store in (self.signed_statuses, self.claimed_statuses, self.in_flight):
+            message_status = store.get(request_id)
+
+            if message_status is not None:
+                return message_status
+
+        message = self.pending_messages.get(request_id)
+
+        if message is not None:
+            return pending_status(message)
+
+        return None
+
+    def notify_signed(self) -> None:
+        with self.signed_condition:
+            self.signed_condition.notify_all()
+
+        for listener in tuple(self.signed_listeners):
+            listener()
+
+    def being_signed(self, request_ids: Iterable[UUID]) -> bool:
+        """Whether any of ``request_ids`` is still pending or in flight."""
+        return any(
+            request_id in self.pending_messages or request_id in self.in_flight
+            for request_id in request_ids
+        )
+
+    def any_signed(self, request_ids: Iterable[UUID]) -> bool:
+        return any(request_id in self.signed_statuses for request_id in request_ids)
+
+    def wait_for_signed(self, request_ids: Iterable[UUID], timeout: float) -> None:
+        """Block until one of ``request_ids`` is signed, or ``timeout`` expires."""
+        request_ids = list(request_ids)
+
+        # Only requests still pending or in flight can change state
+        if not self.being_signed(request_ids):
+            return
+
+        deadline = time.monotonic() + timeout
+
+        with self.signed_condition:
+            while not self.any_signed(request_ids):
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    return
+
+                # Results stored by other workers are not notified, look again
+                # every so often
+                self.signed_condition.wait(
+                    min(remaining, self.config.status_poll_interval)
+                )
+
+    def eviction_stats(self, prefix: str) -> dict[Labels, float]:
+        """Signed status cache ``prefix`` stats per eviction reason."""
+        stats = self.signed_statuses.stats()
+
+        return {
+            (reason,): stats[f"{prefix}_{reason}"]
+            for reason in ("expired", "over_budget")
+        }
+
+    def evict_unclaimed(self) -> None:
+        self.signed_statuses.evict()
+        self.claimed_statuses.evict()
+        self.in_flight.evict()
+
+    def validate_and_sign(self, doc: V1_3.Document) -> Optional[MessageStatus]:
+        try:
+            message_envelope = MessageEnvelope.model_validate_json(
+                decode_content(doc.content)
+            )
+
+        except Exception as e:
+            logger.error("ERROR: could not validate message")
+            logger.debug("Invalid doc: doc=%r, Error %s", doc, e)
+            return None
+
+        return self.sign(message_envelope)
+
+    def record_signing_results(self, results: List[str | Exception]) -> None:
+        """Flag signing failures for :meth:`status`.
+
+        The flag clears once ``signing_recovery_successes`` signatures in a row
+        succeed.
+        """
+        with self.signing_lock:
+            for result in results:
+                if isinstance(result, Exception):
+                    self.signing_error = True
+                    self.signing_successes = 0
+                    continue
+
+                self.signing_successes += 1
+
+                if (
+                    self.signing_error
+                    and self.signing_successes >= self.config.signing_recovery_successes
+                ):
+                    logger.info("Signing recovered, clearing the signing error")
+                    self.signing_error = None
+
     def status(self) -> V1_3.ComponentStatus:
         if self.mode == "frontend":
+            if self.config.hot_mode:
+                component_status = self.warmup_status()
+
+                if component_status is not None:
+                    return component_status
+
+            # Evictions are exported as metrics, they are history rather
+            # than something to act on
+            self.evict_unclaimed()
+
+            errors = []
+
+            requests, queued_bytes = self.queue_usage()
+
+            # New requests are being rejected until the queue drains
+            if self.update_overloaded(requests, queued_bytes):
+                high = self.config.pending_high_watermark
+                high_bytes = self.config.pending_high_watermark_bytes
+
+                errors.append(
+                    V1_3.Error(
+                        code="QUEUE-OVERLOADED",
+                        message=(
+                            f"requests={requests}/{high},"
+                            f" bytes={queued_bytes}/{high_bytes}"
+                        ),
+                    )
+                )
+
             return V1_3.ComponentStatus(
                 status_code=200,
                 status="OK",
-                errors=[],
+                errors=errors,
             )
 
         else:
+            component_status = self.warmup_status()
+
+            if component_status is not None:
+                return component_status
+
             if self.signing_error:
                 return V1_3.ComponentStatus(
                     status_code=500,
@@ -320,19 +993,69 @@ class FBPlugin(PluginProtocol):
                         )
                     ],
                 )
+
+            return self.health_check()
+
+    def health_check(self) -> V1_3.ComponentStatus:
+        """Signing server health, cached for ``health_check_ttl`` seconds.
+
+        Concurrent callers share a single probe.
+        """
+
+        def cached() -> Optional[V1_3.ComponentStatus]:
+            if self.health_cache is None:
+                return None
+
+            probed_at, component_status = self.health_cache
+
+            if time.monotonic() - probed_at >= self.config.health_check_ttl:
+                return None
+
+            return component_status
+
+        component_status = cached()
+
+        if component_status is not None:
+            return component_status
+
+        with self.health_lock:
+            # Another caller probed while we waited
+            component_status = cached()
+
+            if component_status is not None:
+                return component_status
+
             try:
                 component_status = self.signing_server.health_check()
 
             except Exception as e:
                 logger.info("Error getting status")
-                logger.debug(f"Error: {e}")
+                logger.debug("Error: %s", e)
 
-            logger.debug(f"signing server status received: {component_status=}")
+                # Includes an open circuit, the signing server is being shed
+                component_status = V1_3.ComponentStatus(
+                    status_code=503,
+                    status="ERROR",
+                    errors=[
+                        V1_3.Error(
+                            code="SIGNING-SERVER-UNAVAILABLE",
+                            message="Signing server did not answer the health check",
+                        )
+                    ],
+                )
 
-            return component_status
+            logger.debug(
+                "signing server status received: component_status=%r", component_status
+            )
+
+            self.health_cache = (time.monotonic(), component_status)
+
+        return component_status
 
     def sign(self, message_envelope: MessageEnvelope) -> MessageStatus:
-        logger.debug(f"sign: {model_dump_json(message_envelope)}")
+        logger.debug("sign: %s", Payload(message_envelope))
+
+        start = time.perf_counter()
 
         response_type = infer_response_type(
             message_envelope.transportMetadata.request_type
@@ -346,18 +1069,61 @@ class FBPlugin(PluginProtocol):
             response=message_response,
         )
 
-        for message_to_sign in message_envelope.message.payload.messagesToSign:
-            # TODO: Continue on error
+        try:
+            payload = message_envelope.message.parsed_payload
+
+        except Exception as e:
+            logger.info("Error parsing message payload")
+            logger.debug("Error: %s", e)
+
+            message_status.status = MessageState.FAILED
+            message_status.response.errorMessage = "Could not parse message payload"
+
+            return message_status
+
+        failed_indexes: List[int] = []
+        to_sign: List[Tuple[MessageToSign, bytes]] = []
+
+        # Bad input from the agent is not a signing failure
+        for message_to_sign in payload.messagesToSign:
             try:
-                signature = self.signing_server.sign(
-                    key_id=message_envelope.message.payload.signingDeviceKeyId,
-                    data=bytes.fromhex(message_to_sign.message),
+                to_sign.append(
+                    (message_to_sign, bytes.fromhex(message_to_sign.message))
+                )
+
+            except ValueError as e:
+                logger.info("Invalid hex in message index %d", message_to_sign.index)
+                logger.debug("Error: %s", e)
+
+                failed_indexes.append(message_to_sign.index)
+
+        # Resolve the addon once before fanning out
+        signing_server = self.signing_server
+
+        def sign_message(item: Tuple[MessageToSign, bytes]) -> str | Exception:
+            try:
+                return signing_server.sign(
+                    key_id=payload.signingDeviceKeyId, data=item[1]
                 )
 
             except Exception as e:
-                self.signing_error = True
-                logger.info("Error signing message")
-                logger.debug(f"Error: {e}")
+                return e
+
+        if self.config.sign_concurrency > 1 and len(to_sign) > 1:
+            results = list(self.sign_executor.map(sign_message, to_sign))
+
+        else:
+            results = [sign_message(item) for item in to_sign]
+
+        self.record_signing_results(results)
+
+        for (message_to_sign, _), signature in zip(to_sign, results):
+            if isinstance(signature, Exception):
+                logger.info("Error signing message index %d", message_to_sign.index)
+                logger.debug("Error: %s", signature)
+
+                failed_indexes.append(message_to_sign.index)
+                continue
 
             signed_message = SignedMessage(
                 index=message_to_sign.index,
@@ -367,10 +1133,25 @@ class FBPlugin(PluginProtocol):
 
             message_status.response.signedMessages.append(signed_message)
 
-        logger.debug(
-            f"sign returns signed messages: {model_dump_json(message_status)}",
+        message_status.response.signedMessages.sort(
+            key=lambda signed_message: signed_message.index
         )
 
+        labels = (payload.algorithm.value,)
+
+        self.metrics.sign_seconds.observe(time.perf_counter() - start, labels)
+
+        if failed_indexes:
+            self.metrics.sign_failures.inc(len(failed_indexes), labels)
+
+            message_status.status = MessageState.FAILED
+            message_status.response.errorMessage = (
+                "Failed to sign messages at index "
+                f"{', '.join(str(index) for index in sorted(failed_indexes))}"
+            )
+
+        logger.debug("sign returns signed messages: %s", Payload(message_status))
+
         return message_status
 
 
@@ -385,3 +1166,16 @@ def infer_response_type(message_type: RequestType) -> ResponseType:
 
         case RequestType.KEY_LINK_TX_SIGN_REQUEST:
             return ResponseType.KEY_LINK_TX_SIGN_RESPONSE
+
+
+def pending_status(message: MessageEnvelope | QueuedEnvelope) -> MessageStatus:
+    transport_metadata = message.transportMetadata
+
+    # Because the message hasn't been signed,
+    # there is no signedMessages/MessageResponse
+    return MessageStatus(
+        response_type=infer_response_type(transport_metadata.request_type),
+        status=MessageState.PENDING_SIGN,
+        requestId=transport_metadata.requestId,
+        response=MessageResponse(),
+    )
@@ -0,0 +1,217 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+""""""
+
+import logging
+import random
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Literal, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# gRPC status codes worth another attempt
+TRANSIENT_GRPC_CODES = {
+    "ABORTED",
+    "DEADLINE_EXCEEDED",
+    "RESOURCE_EXHAUSTED",
+    "UNAVAILABLE",
+}
+
+
+class CircuitOpenError(Exception):
+    """The signing server is not called while the circuit is open."""
+
+
+def is_transient(error: Exception) -> bool:
+    """Whether ``error`` is a timeout, connection or transient gRPC error."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+
+    # grpc.RpcError, without depending on grpc directly
+    code = getattr(error, "code", None)
+
+    if callable(code):
+        try:
+            return getattr(code(), "name", None) in TRANSIENT_GRPC_CODES
+
+        except Exception:
+            return False
+
+    return False
+
+
+class CircuitBreaker:
+    """Stop calling a failing dependency, and probe it again after a while.
+
+    The circuit opens after ``failure_threshold`` failures in a row. After
+    ``reset_timeout`` seconds a single probe call is let through; it closes the
+    circuit only if it succeeds within ``slow_call_threshold`` seconds.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        slow_call_threshold: float,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.slow_call_threshold = slow_call_threshold
+
+        self.state: Literal["closed", "open", "half_open"] = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """Raise :class:`CircuitOpenError` unless a call may go through."""
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError("Signing server circuit is open")
+
+                self.state = "half_open"
+
+            if self.state == "half_open":
+                if self.probing:
+                    raise CircuitOpenError("Signing server circuit is half open")
+
+                self.probing = True
+
+    def record(self, success: bool, latency: float) -> None:
+        with self._lock:
+            if self.state == "half_open":
+                self.probing = False
+
+                if success and latency <= self.slow_call_threshold:
+                    logger.info("Signing server recovered, closing the circuit")
+                    self.state = "closed"
+                    self.failures = 0
+
+                else:
+                    self.open()
+
+                return
+
+            if success:
+                self.failures = 0
+                return
+
+            self.failures += 1
+
+            if self.state == "closed" and self.failures >= self.failure_threshold:
+                logger.error("Signing server keeps failing, opening the circuit")
+                self.open()
+
+    def open(self) -> None:
+        self.state = "open"
+        self.opened_at = time.monotonic()
+
+
+class ResilientSigningServer:
+    """``SigningServerAddon`` proxy with deadlines, retries and a circuit breaker.
+
+    Every call must finish within ``deadline`` seconds, retries included.
+    Transient errors are retried up to ``retries`` times with full-jitter
+    exponential backoff. Only timeouts and transient errors count as failures
+    for the circuit breaker.
+    """
+
+    def __init__(
+        self,
+        addon: Any,
+        breaker: CircuitBreaker,
+        deadline: float,
+        retries: int,
+        backoff: float,
+        backoff_max: float,
+        max_workers: int,
+    ) -> None:
+        self.addon = addon
+        self.breaker = breaker
+        self.deadline = deadline
+        self.retries = retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+
+        # Calls run here so the caller can give up at the deadline
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="fb-signing-call"
+        )
+
+    def sign(self, *args: Any, **kwargs: Any) -> str:
+        return self.call(self.addon.sign, *args, **kwargs)
+
+    def list_keys(self, *args: Any, **kwargs: Any) -> Any:
+        return self.call(self.addon.list_keys, *args, **kwargs)
+
+    def generate_key_pair(self, *args: Any, **kwargs: Any) -> Any:
+        return self.call(self.addon.generate_key_pair, *args, **kwargs)
+
+    def health_check(self, *args: Any, **kwargs: Any) -> Any:
+        return self.call(self.addon.health_check, *args, **kwargs)
+
+    def call(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        deadline = time.monotonic() + self.deadline
+        attempt = 0
+
+        while True:
+            self.breaker.before_call()
+            start = time.monotonic()
+            future = self.executor.submit(fn, *args, **kwargs)
+
+            try:
+                result = future.result(timeout=max(deadline - start, 0))
+
+            except Exception as e:
+                # Abandoned at the deadline, don't start it late
+                future.cancel()
+
+                # A permanent error, e.g. an unknown key, is a healthy answer
+                # from the signing server and must not shed other tenants
+                transient = is_transient(e)
+                self.breaker.record(not transient, time.monotonic() - start)
+
+                if not transient or attempt >= self.retries:
+                    raise
+
+                delay = random.uniform(
+                    0, min(self.backoff_max, self.backoff * 2**attempt)
+                )
+
+                if time.monotonic() + delay >= deadline:
+                    raise
+
+                attempt += 1
+                logger.info("Retrying signing server call, attempt %d", attempt + 1)
+                logger.debug("Error: %r, Backoff: %.3fs", e, delay)
+
+                time.sleep(delay)
+                continue
+
+            self.breaker.record(True, time.monotonic() - start)
+
+            return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.addon, name)
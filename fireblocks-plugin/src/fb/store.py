@@ -0,0 +1,841 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+""""""
+
+import fcntl
+import itertools
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import (
+    Dict,
+    IO,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+    cast,
+)
+from uuid import UUID
+
+import pydantic
+
+from .utils import model_dump_json
+
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar("T")
+
+
+class Store(Protocol[T]):
+    """Request state keyed by ``requestId``, in insertion order."""
+
+    def put(self, request_id: UUID, item: T, size: Optional[int] = None) -> None: ...
+
+    def get(self, request_id: UUID) -> Optional[T]: ...
+
+    def pop(self, request_id: UUID) -> Optional[T]: ...
+
+    def peek(self, limit: Optional[int] = None) -> List[Tuple[UUID, T]]: ...
+
+    def drain(self) -> List[T]: ...
+
+    def clear(self) -> None: ...
+
+    def evict(self) -> int: ...
+
+    def stats(self) -> Dict[str, int]: ...
+
+    def flush(self) -> None: ...
+
+    def __contains__(self, request_id: object) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[T]: ...
+
+
+class StoreJournal(Protocol):
+    """Persistence backend that makes a :class:`RequestStore` restart-safe.
+
+    Writes are issued in the order the store applies them and may be buffered;
+    :meth:`flush` returns once every write issued before it is durable.
+    """
+
+    def put(self, store: str, request_id: UUID, data: str) -> None: ...
+
+    def delete(self, store: str, request_ids: List[UUID]) -> None: ...
+
+    def flush(self) -> None: ...
+
+    def load(self, store: str) -> List[Tuple[UUID, str]]: ...
+
+    def close(self) -> None: ...
+
+
+class _Flush:
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.error: Optional[Exception] = None
+
+
+class SQLiteJournal:
+    """SQLite (WAL mode) journal with group commit.
+
+    Writers only enqueue their operation; a single background thread applies
+    everything queued since its last commit in one transaction, so concurrent
+    requests share the cost of each commit.
+
+    The writer is started on the first write of each process, so a journal
+    created before a fork is usable in the child. Only one process may write
+    to a journal at a time: another one fails with :class:`RuntimeError`
+    instead of shipping the same recovered requests a second time.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS requests (
+            store TEXT NOT NULL,
+            request_id TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            PRIMARY KEY (store, request_id)
+        )
+    """
+
+    MAX_BATCH = 4096
+    FLUSH_TIMEOUT = 30
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        conn = self._connect()
+
+        try:
+            conn.execute(self.SCHEMA)
+
+        finally:
+            conn.close()
+
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+
+    def put(self, store: str, request_id: UUID, data: str) -> None:
+        ops = self._start()
+
+        with self._seq_lock:
+            self._seq += 1
+
+            ops.put(
+                (
+                    "INSERT INTO requests (store, request_id, seq, data)"
+                    " VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT (store, request_id)"
+                    " DO UPDATE SET data = excluded.data",
+                    (store, str(request_id), self._seq, data),
+                )
+            )
+
+    def delete(self, store: str, request_ids: List[UUID]) -> None:
+        ops = self._start()
+
+        for request_id in request_ids:
+            ops.put(
+                (
+                    "DELETE FROM requests WHERE store = ? AND request_id = ?",
+                    (store, str(request_id)),
+                )
+            )
+
+    def flush(self) -> None:
+        ops = self._queue
+
+        # Nothing was written by this process
+        if ops is None:
+            return
+
+        flush = _Flush()
+        ops.put(flush)
+
+        if not flush.event.wait(self.FLUSH_TIMEOUT):
+            logger.error("Request journal writer did not respond")
+            raise TimeoutError(
+                f"Request journal not flushed within {self.FLUSH_TIMEOUT}s"
+            )
+
+        if flush.error is not None:
+            raise flush.error
+
+    def load(self, store: str) -> List[Tuple[UUID, str]]:
+        self.flush()
+
+        conn = self._connect()
+
+        try:
+            return [
+                (UUID(request_id), data)
+                for request_id, data in conn.execute(
+                    "SELECT request_id, data FROM requests"
+                    " WHERE store = ? ORDER BY seq",
+                    (store,),
+                )
+            ]
+
+        finally:
+            conn.close()
+
+    def close(self) -> None:
+        if self._queue is None:
+            return
+
+        self.flush()
+        self._queue.put(None)
+
+        assert self._writer is not None and self._lock_file is not None
+        self._writer.join()
+        self._lock_file.close()
+        self._reset()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reset(self) -> None:
+        # Also runs in a forked child: the writer thread did not survive the
+        # fork and the parent's connection and locks must not be used there
+        lock_file = getattr(self, "_lock_file", None)
+
+        if lock_file is not None:
+            lock_file.close()
+
+        self._start_lock = threading.Lock()
+        self._seq_lock = threading.Lock()
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._lock_file: Optional[IO[str]] = None
+
+    def _start(self) -> queue.SimpleQueue:
+        ops = self._queue
+
+        if ops is not None:
+            return ops
+
+        with self._start_lock:
+            if self._queue is not None:
+                return self._queue
+
+            # POSIX record locks belong to the process and are not inherited
+            lock_file = open(self.path + ".lock", "a")
+
+            try:
+                fcntl.lockf(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            except OSError:
+                lock_file.close()
+                logger.error("Request journal is in use by another process")
+                raise RuntimeError(
+                    f"{self.path} is in use by another process, use the"
+                    " 'shared' store backend with more than one worker"
+                )
+
+            conn = self._connect()
+            (self._seq,) = conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM requests"
+            ).fetchone()
+
+            ops = queue.SimpleQueue()
+            self._writer = threading.Thread(
+                target=self._run, args=(conn, ops), name="fb-journal", daemon=True
+            )
+            self._writer.start()
+            self._lock_file = lock_file
+            self._queue = ops
+
+            return ops
+
+    def _run(self, conn: sqlite3.Connection, ops: queue.SimpleQueue) -> None:
+        while True:
+            batch = [ops.get()]
+
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(ops.get_nowait())
+
+                except queue.Empty:
+                    break
+
+            flushes = [op for op in batch if isinstance(op, _Flush)]
+            error = None
+
+            try:
+                conn.execute("BEGIN")
+
+                for op in batch:
+                    if isinstance(op, tuple):
+                        conn.execute(*op)
+
+                conn.execute("COMMIT")
+
+            except Exception as e:
+                logger.error("Could not commit request journal batch")
+                logger.debug("Batch size: %d, Error: %s", len(batch), e)
+                error = e
+
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+
+            for flush in flushes:
+                flush.error = error
+                flush.event.set()
+
+            if None in batch:
+                conn.close()
+                return
+
+
+class RequestStore(Generic[T]):
+    """Insertion-ordered store of Fireblocks request state keyed by ``requestId``.
+
+    Lookups, insertions and removals are O(1) per id, and iteration / draining
+    follow insertion order so ``to_oso`` ships documents in FIFO order.
+
+    When a ``journal`` is given every change is also written to it, and the
+    store is rebuilt from it on construction. ``model`` is the pydantic model
+    (or a type with the same JSON methods) used to encode items for the journal.
+
+    ``ttl`` (seconds) and ``max_bytes`` bound the store when :meth:`evict` is
+    called; the oldest items go first. Item sizes are the length of their JSON
+    encoding, so the budget tracks payload size rather than exact heap usage.
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        model: Optional[type[pydantic.BaseModel]] = None,
+        journal: Optional[StoreJournal] = None,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self._items: OrderedDict[UUID, T] = OrderedDict()
+        # requestId -> (insertion time, encoded size)
+        self._meta: Dict[UUID, Tuple[float, int]] = {}
+        self._bytes = 0
+        self._evicted = {"expired": 0, "over_budget": 0}
+        self._evicted_bytes = {"expired": 0, "over_budget": 0}
+        self._lock = threading.RLock()
+
+        self._model = model
+        self._journal = journal
+
+        if self._journal is not None:
+            self.recover()
+
+    def recover(self) -> None:
+        """Rebuild the in-memory index from the journal."""
+        assert self._journal is not None and self._model is not None
+
+        with self._lock:
+            self._clear()
+            now = time.monotonic()
+
+            for request_id, data in self._journal.load(self.name):
+                try:
+                    self._items[request_id] = self._model.model_validate_json(data)
+
+                except Exception as e:
+                    logger.error("Could not recover journaled request")
+                    logger.debug("Request: %s, Error: %s", request_id, e)
+                    continue
+
+                self._meta[request_id] = (now, len(data))
+                self._bytes += len(data)
+
+        logger.info("Recovered %d requests into '%s'", len(self._items), self.name)
+
+    def put(self, request_id: UUID, item: T, size: Optional[int] = None) -> None:
+        """Insert or replace ``item``.
+
+        ``size`` is the item's encoded length when the caller already knows it.
+        """
+        data = None
+
+        if self._journal is not None or (size is None and self.max_bytes is not None):
+            data = model_dump_json(item)
+
+        if size is None:
+            size = len(data) if data is not None else 0
+
+        with self._lock:
+            if request_id in self._meta:
+                added, old_size = self._meta[request_id]
+                self._bytes -= old_size
+
+            else:
+                added = time.monotonic()
+
+            self._items[request_id] = item
+            self._meta[request_id] = (added, size)
+            self._bytes += size
+
+            if self._journal is not None and data is not None:
+                self._journal.put(self.name, request_id, data)
+
+    def get(self, request_id: UUID) -> Optional[T]:
+        return self._items.get(request_id)
+
+    def pop(self, request_id: UUID) -> Optional[T]:
+        with self._lock:
+            item = self._items.pop(request_id, None)
+
+            if item is not None:
+                self._bytes -= self._meta.pop(request_id)[1]
+
+                if self._journal is not None:
+                    self._journal.delete(self.name, [request_id])
+
+        return item
+
+    def peek(self, limit: Optional[int] = None) -> List[Tuple[UUID, T]]:
+        """Return up to ``limit`` of the oldest items without removing them."""
+        with self._lock:
+            return list(itertools.islice(self._items.items(), limit))
+
+    def drain(self) -> List[T]:
+        """Remove and return every item in insertion order."""
+        with self._lock:
+            request_ids = list(self._items.keys())
+            items = list(self._items.values())
+            self._clear()
+
+            if self._journal is not None:
+                self._journal.delete(self.name, request_ids)
+
+        return items
+
+    def clear(self) -> None:
+        self.drain()
+
+    def evict(self) -> int:
+        """Drop expired items, then the oldest items while over ``max_bytes``.
+
+        Returns the number of evicted items.
+        """
+        if self.ttl is None and self.max_bytes is None:
+            return 0
+
+        evicted: List[UUID] = []
+
+        with self._lock:
+            if self.ttl is not None:
+                deadline = time.monotonic() - self.ttl
+
+                for request_id, (added, size) in self._meta.items():
+                    if added > deadline:
+                        break
+
+                    evicted.append(request_id)
+                    self._evicted_bytes["expired"] += size
+
+                self._evicted["expired"] += len(evicted)
+
+            if self.max_bytes is not None:
+                over_budget = 0
+                remaining = self._bytes - sum(self._meta[i][1] for i in evicted)
+
+                for request_id, (_, size) in itertools.islice(
+                    self._meta.items(), len(evicted), None
+                ):
+                    if remaining <= self.max_bytes:
+                        break
+
+                    evicted.append(request_id)
+                    remaining -= size
+                    over_budget += 1
+                    self._evicted_bytes["over_budget"] += size
+
+                self._evicted["over_budget"] += over_budget
+
+            for request_id in evicted:
+                del self._items[request_id]
+                self._bytes -= self._meta.pop(request_id)[1]
+
+            if evicted and self._journal is not None:
+                self._journal.delete(self.name, evicted)
+
+        if evicted:
+            logger.info(
+                "Evicted %d unclaimed requests from '%s'", len(evicted), self.name
+            )
+
+        return len(evicted)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._items),
+            "bytes": self._bytes,
+            "evicted_expired": self._evicted["expired"],
+            "evicted_over_budget": self._evicted["over_budget"],
+            "evicted_bytes_expired": self._evicted_bytes["expired"],
+            "evicted_bytes_over_budget": self._evicted_bytes["over_budget"],
+        }
+
+    def flush(self) -> None:
+        """Block until every change so far is durable in the journal."""
+        if self._journal is not None:
+            self._journal.flush()
+
+    def _clear(self) -> None:
+        self._items.clear()
+        self._meta.clear()
+        self._bytes = 0
+
+    def __contains__(self, request_id: object) -> bool:
+        return request_id in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        with self._lock:
+            return iter(list(self._items.values()))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items.keys())!r})"
+
+
+class SQLiteRequestStore(Generic[T]):
+    """:class:`RequestStore` kept in a SQLite database shared between processes.
+
+    Every operation is its own transaction against the database, so gunicorn
+    workers opening the same ``path`` see the same requests, and a request is
+    popped by exactly one of them. Items are encoded with ``model``.
+
+    ``ttl`` and ``max_bytes`` behave as for :class:`RequestStore`, with wall
+    clock insertion times since those are comparable between processes.
+    """
+
+    SCHEMA = [
+        """
+        CREATE TABLE IF NOT EXISTS shared_requests (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            store TEXT NOT NULL,
+            request_id TEXT NOT NULL,
+            added REAL NOT NULL,
+            size INTEGER NOT NULL,
+            data TEXT NOT NULL,
+            UNIQUE (store, request_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS shared_evictions (
+            store TEXT NOT NULL,
+            reason TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            bytes INTEGER NOT NULL,
+            PRIMARY KEY (store, reason)
+        )
+        """,
+    ]
+
+    # Seconds to wait for another process' write lock
+    BUSY_TIMEOUT = 30
+
+    def __init__(
+        self,
+        path: str,
+        name: str,
+        model: type[pydantic.BaseModel],
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.path = path
+        self.name = name
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self._model = model
+        # sqlite3 connections must not be shared between threads, nor with a
+        # forked child, so they are cached per thread and process
+        self._local = threading.local()
+
+        # Not cached: the store may be built before the server forks
+        conn = self._connect()
+
+        try:
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path, timeout=self.BUSY_TIMEOUT, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        pid, conn = getattr(self._local, "conn", (None, None))
+
+        # A connection inherited through fork is left alone, not even closed
+        if conn is None or pid != os.getpid():
+            conn = self._connect()
+            self._local.conn = (os.getpid(), conn)
+
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._conn
+        # Take the write lock up front so concurrent writers queue, not deadlock
+        conn.execute("BEGIN IMMEDIATE")
+
+        try:
+            yield conn
+
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        conn.execute("COMMIT")
+
+    def _decode(self, data: str) -> T:
+        return cast(T, self._model.model_validate_json(data))
+
+    def put(self, request_id: UUID, item: T, size: Optional[int] = None) -> None:
+        """Insert or replace ``item``, keeping the position of a replaced item."""
+        data = model_dump_json(cast(pydantic.BaseModel, item))
+
+        self._conn.execute(
+            "INSERT INTO shared_requests (store, request_id, added, size, data)"
+            " VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (store, request_id)"
+            " DO UPDATE SET size = excluded.size, data = excluded.data",
+            (
+                self.name,
+                str(request_id),
+                time.time(),
+                size if size is not None else len(data),
+                data,
+            ),
+        )
+
+    def get(self, request_id: UUID) -> Optional[T]:
+        row = self._conn.execute(
+            "SELECT data FROM shared_requests WHERE store = ? AND request_id = ?",
+            (self.name, str(request_id)),
+        ).fetchone()
+
+        return self._decode(row[0]) if row is not None else None
+
+    def pop(self, request_id: UUID) -> Optional[T]:
+        # Exhaust the cursor, so the statement completes and commits
+        rows = self._conn.execute(
+            "DELETE FROM shared_requests WHERE store = ? AND request_id = ?"
+            " RETURNING data",
+            (self.name, str(request_id)),
+        ).fetchall()
+
+        return self._decode(rows[0][0]) if rows else None
+
+    def peek(self, limit: Optional[int] = None) -> List[Tuple[UUID, T]]:
+        """Return up to ``limit`` of the oldest items without removing them."""
+        return [
+            (UUID(request_id), self._decode(data))
+            for request_id, data in self._conn.execute(
+                "SELECT request_id, data FROM shared_requests WHERE store = ?"
+                " ORDER BY seq LIMIT ?",
+                (self.name, limit if limit is not None else -1),
+            )
+        ]
+
+    def drain(self) -> List[T]:
+        """Remove and return every item in insertion order."""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT data FROM shared_requests WHERE store = ? ORDER BY seq",
+                (self.name,),
+            ).fetchall()
+            conn.execute("DELETE FROM shared_requests WHERE store = ?", (self.name,))
+
+        return [self._decode(data) for (data,) in rows]
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM shared_requests WHERE store = ?", (self.name,))
+
+    def evict(self) -> int:
+        """Drop expired items, then the oldest items while over ``max_bytes``.
+
+        Returns the number of evicted items.
+        """
+        if self.ttl is None and self.max_bytes is None:
+            return 0
+
+        # Called on every status poll, only take the write lock when something
+        # is to be evicted
+        oldest, total = self._conn.execute(
+            "SELECT MIN(added), COALESCE(SUM(size), 0) FROM shared_requests"
+            " WHERE store = ?",
+            (self.name,),
+        ).fetchone()
+
+        expired = (
+            self.ttl is not None
+            and oldest is not None
+            and oldest <= time.time() - self.ttl
+        )
+        over_budget = self.max_bytes is not None and total > self.max_bytes
+
+        if not expired and not over_budget:
+            return 0
+
+        # reason -> (count, bytes)
+        evicted = {"expired": (0, 0), "over_budget": (0, 0)}
+
+        with self._transaction() as conn:
+            if self.ttl is not None:
+                deadline = time.time() - self.ttl
+                evicted["expired"] = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM shared_requests"
+                    " WHERE store = ? AND added <= ?",
+                    (self.name, deadline),
+                ).fetchone()
+                conn.execute(
+                    "DELETE FROM shared_requests WHERE store = ? AND added <= ?",
+                    (self.name, deadline),
+                )
+
+            if self.max_bytes is not None:
+                (total,) = conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM shared_requests"
+                    " WHERE store = ?",
+                    (self.name,),
+                ).fetchone()
+
+                last_seq = None
+                over_budget = 0
+                over_budget_bytes = 0
+
+                if total > self.max_bytes:
+                    for seq, size in conn.execute(
+                        "SELECT seq, size FROM shared_requests WHERE store = ?"
+                        " ORDER BY seq",
+                        (self.name,),
+                    ):
+                        if total <= self.max_bytes:
+                            break
+
+                        total -= size
+                        last_seq = seq
+                        over_budget += 1
+                        over_budget_bytes += size
+
+                if last_seq is not None:
+                    conn.execute(
+                        "DELETE FROM shared_requests WHERE store = ? AND seq <= ?",
+                        (self.name, last_seq),
+                    )
+                    evicted["over_budget"] = (over_budget, over_budget_bytes)
+
+            for reason, (count, size) in evicted.items():
+                if count:
+                    conn.execute(
+                        "INSERT INTO shared_evictions (store, reason, count, bytes)"
+                        " VALUES (?, ?, ?, ?)"
+                        " ON CONFLICT (store, reason) DO UPDATE SET"
+                        " count = count + excluded.count,"
+                        " bytes = bytes + excluded.bytes",
+                        (self.name, reason, count, size),
+                    )
+
+        total_evicted = sum(count for count, _ in evicted.values())
+
+        if total_evicted:
+            logger.info(
+                "Evicted %d unclaimed requests from '%s'", total_evicted, self.name
+            )
+
+        return total_evicted
+
+    def stats(self) -> Dict[str, int]:
+        entries, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM shared_requests"
+            " WHERE store = ?",
+            (self.name,),
+        ).fetchone()
+
+        evicted = {
+            reason: (count, size)
+            for reason, count, size in self._conn.execute(
+                "SELECT reason, count, bytes FROM shared_evictions WHERE store = ?",
+                (self.name,),
+            )
+        }
+        expired = evicted.get("expired", (0, 0))
+        over_budget = evicted.get("over_budget", (0, 0))
+
+        return {
+            "entries": entries,
+            "bytes": total,
+            "evicted_expired": expired[0],
+            "evicted_over_budget": over_budget[0],
+            "evicted_bytes_expired": expired[1],
+            "evicted_bytes_over_budget": over_budget[1],
+        }
+
+    def flush(self) -> None:
+        """Every change is committed as it is made."""
+
+    def __contains__(self, request_id: object) -> bool:
+        return (
+            self._conn.execute(
+                "SELECT 1 FROM shared_requests WHERE store = ? AND request_id = ?",
+                (self.name, str(request_id)),
+            ).fetchone()
+            is not None
+        )
+
+    def __len__(self) -> int:
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM shared_requests WHERE store = ?", (self.name,)
+        ).fetchone()
+
+        return count
+
+    def __iter__(self) -> Iterator[T]:
+        return iter([item for _, item in self.peek()])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r}, {self.name!r})"
@@ -16,11 +16,14 @@
 
 # https://github.com/fireblocks/fireblocks-agent/blob/main/api/customer-server.api.yml
 
+from functools import cached_property
 from typing import Dict, List, Optional, Annotated
-from pydantic import BaseModel, Field, Json, field_serializer, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict
 from enum import auto, StrEnum
 from uuid import UUID
 
+from .utils import model_dump_json_bytes
+
 
 class UpperStrEnum(StrEnum):
     @staticmethod
@@ -92,11 +95,12 @@ class MessagePayload(BaseModel):
 
 class Message(BaseModel):
     payloadSignatureData: PayloadSignatureData
-    payload: Json[MessagePayload]
+    # Kept verbatim as sent by Fireblocks, and only parsed when signing
+    payload: str
 
-    @field_serializer("payload")
-    def serialize_payload(self, payload: MessagePayload) -> str:
-        return payload.model_dump_json()
+    @cached_property
+    def parsed_payload(self) -> MessagePayload:
+        return MessagePayload.model_validate_json(self.payload)
 
 
 class TransportMetadata(BaseModel):
@@ -115,6 +119,60 @@ class MessagesRequest(BaseModel):
     messages: List[MessageEnvelope]
 
 
+class QueuedEnvelope:
+    """Compact form of a ``MessageEnvelope`` waiting in the frontend queue.
+
+    Only the requestId (16 bytes), a request type code and the envelope's JSON
+    are kept; the models are rebuilt on demand. It encodes and decodes like a
+    model, so request stores and their journals handle it unchanged.
+    """
+
+    __slots__ = ("request_id", "type_code", "data")
+
+    REQUEST_TYPES = list(RequestType)
+
+    def __init__(self, request_id: UUID, request_type: RequestType, data: bytes):
+        self.request_id = request_id.bytes
+        self.type_code = self.REQUEST_TYPES.index(request_type)
+        self.data = data
+
+    @classmethod
+    def from_envelope(cls, envelope: MessageEnvelope) -> "QueuedEnvelope":
+        return cls(
+            envelope.transportMetadata.requestId,
+            envelope.transportMetadata.request_type,
+            model_dump_json_bytes(envelope),
+        )
+
+    @classmethod
+    def model_validate_json(cls, data: str | bytes) -> "QueuedEnvelope":
+        if isinstance(data, str):
+            data = data.encode()
+
+        transport_metadata = MessageEnvelope.model_validate_json(data).transportMetadata
+
+        return cls(transport_metadata.requestId, transport_metadata.request_type, data)
+
+    def model_dump_json(self, **kwargs) -> str:
+        return self.data.decode()
+
+    @property
+    def transportMetadata(self) -> TransportMetadata:
+        return TransportMetadata(
+            requestId=UUID(bytes=self.request_id),
+            request_type=self.REQUEST_TYPES[self.type_code],
+        )
+
+    def envelope(self) -> MessageEnvelope:
+        return MessageEnvelope.model_validate_json(self.data)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, QueuedEnvelope) and self.data == other.data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({UUID(bytes=self.request_id)!s})"
+
+
 class SignedMessage(BaseModel):
     message: str
     signature: str
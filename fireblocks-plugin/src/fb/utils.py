@@ -19,6 +19,8 @@ import pydantic
 
 from typing import Any
 
+from flask import Response
+
 
 def model_dump_json(model: pydantic.BaseModel) -> str:
     return model.model_dump_json(by_alias=True, exclude_none=True)
@@ -28,6 +30,21 @@ def model_dump(model: pydantic.BaseModel) -> dict[str, Any]:
     return model.model_dump(by_alias=True, exclude_none=True)
 
 
+def model_dump_json_bytes(model: pydantic.BaseModel) -> bytes:
+    return model.__pydantic_serializer__.to_json(
+        model, by_alias=True, exclude_none=True
+    )
+
+
+def model_response(model: pydantic.BaseModel, status: int = 200) -> Response:
+    """JSON response encoded once by pydantic-core, newline-terminated like jsonify."""
+    return Response(
+        model_dump_json_bytes(model) + b"\n",
+        status=status,
+        mimetype="application/json",
+    )
+
+
 def log_error(
     logger: logging.Logger, msg: str, debug_msg: str, error_type: type[Exception]
 ) -> None:
@@ -0,0 +1,160 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+""""""
+
+import datetime
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import threading
+import time
+import uuid
+
+import pytest
+
+from fb.types import MessageEnvelope, MessagesRequest
+
+from oso.framework.data.types import V1_3
+from oso.framework.plugin import current_oso_plugin_app
+
+
+@pytest.fixture(scope="session")
+def make_envelopes():
+    """Factory for distinct copies of the sample ``MessageEnvelope``."""
+    with open("tests/data/messages_request.json", "r") as file:
+        template = MessagesRequest.model_validate(json.load(file)).messages[0]
+
+    def _fn(count: int) -> list[MessageEnvelope]:
+        envelopes = []
+        for _ in range(count):
+            envelope = template.model_copy()
+            envelope.transportMetadata = template.transportMetadata.model_copy(
+                update={"requestId": uuid.uuid4()}
+            )
+            envelopes.append(envelope)
+
+        return envelopes
+
+    return _fn
+
+
+class FakeSigningServer:
+    """In-process signing server with a fixed latency per call.
+
+    Signatures are deterministic digests of the key id and data. Everything
+    else, e.g. key generation against the fake gRPC stub, goes to ``addon``.
+    """
+
+    def __init__(self, addon, latency: float = 0.002) -> None:
+        self.addon = addon
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def sign(self, key_id, data):
+        time.sleep(self.latency)
+
+        with self._lock:
+            self.calls += 1
+
+        return hashlib.sha256(key_id.encode() + data).hexdigest()
+
+    def health_check(self):
+        time.sleep(self.latency)
+        return V1_3.ComponentStatus(status_code=200, status="OK")
+
+    def __getattr__(self, name):
+        return getattr(self.addon, name)
+
+
+@pytest.fixture
+def fake_signing_server(app, mocker) -> FakeSigningServer:
+    """Route the plugin's signing server calls to a :class:`FakeSigningServer`.
+
+    Calls still go through the plugin's deadlines, retries and circuit breaker.
+    """
+    signing_server = current_oso_plugin_app().signing_server
+    fake = FakeSigningServer(signing_server.addon)
+
+    mocker.patch.object(signing_server, "addon", fake)
+
+    return fake
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+
+    except Exception:
+        return None
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    """Results of the session, written to ``$BENCHMARK_RESULTS/benchmarks.json``."""
+    results: list[dict] = []
+
+    yield results
+
+    output_dir = os.environ.get("BENCHMARK_RESULTS")
+
+    if not output_dir or not results:
+        return
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    with open(os.path.join(output_dir, "benchmarks.json"), "w") as file:
+        json.dump(
+            {
+                "commit": git_commit(),
+                "timestamp": datetime.datetime.now(datetime.UTC).isoformat(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+
+
+@pytest.fixture
+def record_benchmark(request, benchmark_results):
+    """Record one measurement of the current benchmark, e.g.
+    ``record_benchmark("throughput", 120.5, "docs/s", in_flight=4)``.
+    """
+
+    def _fn(metric: str, value: float, unit: str, **params) -> None:
+        benchmark_results.append(
+            {
+                "benchmark": request.node.name,
+                "metric": metric,
+                "value": value,
+                "unit": unit,
+                "params": params,
+            }
+        )
+
+        labels = "".join(f" {key}={value}" for key, value in params.items())
+        print(f"{request.node.name}:{labels} {metric}={value:.3f} {unit}")
+
+    return _fn
@@ -0,0 +1,115 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fb.asgi import CustomerServerASGI
+from fb.plugin import FBPlugin
+from fb.types import MessagesRequest
+
+from oso.framework.plugin import current_oso_plugin_app
+
+
+REQUESTS = 200
+SIGN_LATENCY = 0.05
+# Sync worker count of a typical gunicorn deployment
+WORKERS = 4
+
+HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"x-test-ssl-verify", b"SUCCESS"),
+    (b"x-test-ssl-fingerprint", b"VALID"),
+]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_bench_asgi_hot_mode_throughput(
+    mode, app, client, fake_signing_server, make_envelopes, record_benchmark
+):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.config.hot_mode = True
+
+    fake_signing_server.latency = SIGN_LATENCY
+
+    def bodies() -> list[bytes]:
+        return [
+            MessagesRequest(messages=make_envelopes(1)).model_dump_json().encode()
+            for _ in range(REQUESTS)
+        ]
+
+    # Flask behind a fixed pool of sync workers
+    wsgi_bodies = bodies()
+
+    def _post(body: bytes) -> int:
+        return client.post(
+            "/internal/messagesToSign",
+            data=body,
+            headers={k.decode(): v.decode() for k, v in HEADERS},
+        ).status_code
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        assert set(executor.map(_post, wsgi_bodies)) == {200}
+    wsgi_throughput = REQUESTS / (time.perf_counter() - start)
+
+    # Every request in flight at once on the event loop
+    asgi_app = CustomerServerASGI(app, max_threads=REQUESTS)
+    asgi_bodies = bodies()
+
+    async def _request(body: bytes) -> int:
+        received = iter([{"type": "http.request", "body": body}])
+        status = 0
+
+        async def receive():
+            return next(received)
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await asgi_app(
+            {
+                "type": "http",
+                "method": "POST",
+                "path": "/internal/messagesToSign",
+                "headers": HEADERS,
+            },
+            receive,
+            send,
+        )
+
+        return status
+
+    async def _load() -> list[int]:
+        return await asyncio.gather(*(_request(body) for body in asgi_bodies))
+
+    start = time.perf_counter()
+    assert set(asyncio.run(_load())) == {200}
+    asgi_throughput = REQUESTS / (time.perf_counter() - start)
+
+    record_benchmark("throughput", wsgi_throughput, "req/s", server="wsgi")
+    record_benchmark("throughput", asgi_throughput, "req/s", server="asgi")
+
+    assert asgi_throughput > 2 * wsgi_throughput
@@ -0,0 +1,70 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import pytest
+
+from fb.plugin import FBPlugin
+from fb.utils import model_dump_json
+
+from oso.framework.data.types import V1_3
+from oso.framework.plugin import current_oso_plugin_app
+
+
+DOCUMENTS = 200
+SIGN_LATENCY = 0.002
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", ["backend"])
+def test_bench_backend_pipeline_throughput(
+    mode, client, fake_signing_server, make_envelopes, record_benchmark
+):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fake_signing_server.latency = SIGN_LATENCY
+
+    document_list = V1_3.DocumentList(
+        documents=[
+            V1_3.Document(
+                id=str(envelope.transportMetadata.requestId),
+                content=model_dump_json(envelope),
+                metadata="",
+            )
+            for envelope in make_envelopes(DOCUMENTS)
+        ],
+        count=DOCUMENTS,
+    )
+
+    throughput: dict[int, float] = {}
+
+    for in_flight in [1, fb_plugin.config.pipeline_in_flight]:
+        fb_plugin.config.pipeline_in_flight = in_flight
+
+        start = time.perf_counter()
+        fb_plugin.to_isv(document_list)
+        elapsed = time.perf_counter() - start
+
+        assert len(fb_plugin.to_oso().documents) == DOCUMENTS
+
+        throughput[in_flight] = DOCUMENTS / elapsed
+        record_benchmark(
+            "throughput", throughput[in_flight], "docs/s", in_flight=in_flight
+        )
+
+    assert throughput[fb_plugin.config.pipeline_in_flight] > 2 * throughput[1]
@@ -0,0 +1,79 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+import uuid
+
+import pytest
+
+from fb.codec import decode_content, encode_content
+from fb.types import (
+    MessageResponse,
+    MessageState,
+    MessageStatus,
+    ResponseType,
+    SignedMessage,
+)
+from fb.utils import model_dump_json
+
+
+BATCH = 1000
+MESSAGES_PER_TX = 8
+
+
+def make_statuses(count: int) -> list[MessageStatus]:
+    return [
+        MessageStatus(
+            response_type=ResponseType.KEY_LINK_TX_SIGN_RESPONSE,
+            status=MessageState.SIGNED,
+            requestId=uuid.uuid4(),
+            response=MessageResponse(
+                signedMessages=[
+                    SignedMessage(
+                        message=uuid.uuid4().hex * 2,
+                        signature=(uuid.uuid4().hex * 4),
+                        index=index,
+                    )
+                    for index in range(MESSAGES_PER_TX)
+                ]
+            ),
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("kind", ["envelopes", "statuses"])
+def test_bench_content_compression(kind, make_envelopes, record_benchmark):
+    models = make_envelopes(BATCH) if kind == "envelopes" else make_statuses(BATCH)
+    contents = [model_dump_json(model) for model in models]
+
+    start = time.perf_counter()
+    encoded = [encode_content(content, "zlib") for content in contents]
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = [decode_content(content) for content in encoded]
+    decode_time = time.perf_counter() - start
+
+    assert decoded == contents
+
+    raw_bytes = sum(len(content) for content in contents)
+    encoded_bytes = sum(len(content) for content in encoded)
+
+    record_benchmark("ratio", raw_bytes / encoded_bytes, "x", kind=kind)
+    record_benchmark("encode", encode_time / BATCH * 1e6, "us/doc", kind=kind)
+    record_benchmark("decode", decode_time / BATCH * 1e6, "us/doc", kind=kind)
@@ -0,0 +1,72 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import pytest
+
+from fb.plugin import FBPlugin
+from fb.types import MessagesRequest, MessagesStatusRequest, MessageState
+
+from oso.framework.plugin import current_oso_plugin_app
+
+
+ENVELOPES = 100
+SIGN_LATENCY = 0.005
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", ["frontend"])
+@pytest.mark.parametrize("hot_mode_async", [False, True])
+def test_bench_hot_mode_signing(
+    mode, hot_mode_async, client, fake_signing_server, make_envelopes, record_benchmark
+):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.config.hot_mode = True
+    fb_plugin.config.hot_mode_async = hot_mode_async
+    fake_signing_server.latency = SIGN_LATENCY
+
+    envelopes = make_envelopes(ENVELOPES)
+    request_ids = [envelope.transportMetadata.requestId for envelope in envelopes]
+
+    start = time.perf_counter()
+    response = fb_plugin.messagesToSign(MessagesRequest(messages=envelopes))
+    acknowledged = time.perf_counter() - start
+
+    signed = {
+        status.requestId
+        for status in response.statuses
+        if status.status == MessageState.SIGNED
+    }
+
+    while len(signed) < ENVELOPES:
+        response = fb_plugin.messagesStatus(
+            MessagesStatusRequest(requestsIds=request_ids), wait=5
+        )
+        signed.update(
+            status.requestId
+            for status in response.statuses
+            if status.status == MessageState.SIGNED
+        )
+
+    all_signed = time.perf_counter() - start
+
+    params = {"async": hot_mode_async, "envelopes": ENVELOPES}
+    record_benchmark("ack_latency", acknowledged * 1e3, "ms", **params)
+    record_benchmark("all_signed", all_signed * 1e3, "ms", **params)
+    record_benchmark("throughput", ENVELOPES / all_signed, "envelopes/s", **params)
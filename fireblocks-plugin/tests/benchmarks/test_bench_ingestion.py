@@ -0,0 +1,69 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import pytest
+
+from fb.plugin import FBPlugin
+from fb.types import MessagesRequest
+
+from oso.framework.plugin import current_oso_plugin_app
+
+
+ENVELOPES = 2_000
+BATCH_SIZES = [1, 100]
+
+HEADERS = {
+    "X-TEST-SSL-VERIFY": "True",
+    "X-TEST-SSL-FINGERPRINT": "VALID",
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", ["frontend"])
+@pytest.mark.parametrize("batch_size", BATCH_SIZES)
+def test_bench_messages_to_sign_ingestion(
+    mode, batch_size, client, make_envelopes, record_benchmark
+):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    envelopes = make_envelopes(ENVELOPES)
+    bodies = [
+        MessagesRequest(messages=envelopes[i : i + batch_size]).model_dump_json()
+        for i in range(0, ENVELOPES, batch_size)
+    ]
+
+    start = time.perf_counter()
+    for body in bodies:
+        response = client.post(
+            "/internal/messagesToSign",
+            data=body,
+            content_type="application/json",
+            headers=HEADERS,
+        )
+        assert response.status_code == 200
+    elapsed = time.perf_counter() - start
+
+    assert len(fb_plugin.pending_messages) == ENVELOPES
+
+    record_benchmark(
+        "throughput", ENVELOPES / elapsed, "envelopes/s", batch_size=batch_size
+    )
+    record_benchmark(
+        "request_latency", elapsed / len(bodies) * 1e3, "ms", batch_size=batch_size
+    )
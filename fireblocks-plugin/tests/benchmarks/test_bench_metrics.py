@@ -0,0 +1,42 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import timeit
+
+import pytest
+
+from fb.metrics import PluginMetrics
+
+
+EVENTS = 200_000
+
+
+@pytest.mark.benchmark
+def test_bench_metrics_event_cost(record_benchmark):
+    metrics = PluginMetrics()
+
+    def _count():
+        metrics.to_isv_documents.inc()
+
+    def _observe():
+        metrics.sign_seconds.observe(0.004, ("ECDSA_SECP256K1",))
+
+    for name, fn in [("counter", _count), ("histogram", _observe)]:
+        per_event = min(timeit.repeat(fn, number=EVENTS, repeat=3)) / EVENTS
+
+        record_benchmark("cost", per_event * 1e9, "ns/event", metric_type=name)
+
+        assert per_event < 1e-6
@@ -0,0 +1,62 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+import time
+
+import pytest
+
+from fb.types import MessagesRequest
+
+
+MESSAGE_COUNTS = [1, 100, 10_000]
+
+
+def best_of(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+
+    return min(samples)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", MESSAGE_COUNTS)
+def test_bench_messages_request_parse(count, make_envelopes, record_benchmark):
+    body = MessagesRequest(messages=make_envelopes(count)).model_dump_json(
+        by_alias=True, exclude_none=True
+    )
+    raw_data = body.encode()
+    repeat = max(3, 1000 // count)
+
+    # Previous path: request.get_json() followed by model_validate()
+    two_pass = best_of(
+        lambda: MessagesRequest.model_validate(json.loads(raw_data)), repeat
+    )
+    single_pass = best_of(lambda: MessagesRequest.model_validate_json(raw_data), repeat)
+
+    record_benchmark(
+        "parse_time", two_pass * 1e3, "ms", messages=count, path="two_pass"
+    )
+    record_benchmark(
+        "parse_time", single_pass * 1e3, "ms", messages=count, path="single_pass"
+    )
+
+    assert MessagesRequest.model_validate_json(
+        raw_data
+    ) == MessagesRequest.model_validate(json.loads(raw_data))
@@ -0,0 +1,69 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import gc
+import json
+import tracemalloc
+import uuid
+
+import pytest
+
+from fb.store import RequestStore
+from fb.types import MessageEnvelope, QueuedEnvelope
+
+
+REQUESTS = 100_000
+
+
+def queued_footprint(compact: bool) -> float:
+    """Bytes retained per request by a pending queue of ``REQUESTS`` envelopes."""
+    with open("tests/data/messages_request.json", "r") as file:
+        body = json.dumps(json.load(file)["messages"][0])
+
+    template = body.replace("a4963c1f-f2be-4e3c-9a3a-0d2627aaf9bc", "{request_id}")
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    store: RequestStore = RequestStore("pending")
+
+    for _ in range(REQUESTS):
+        # Parsed as on ingestion, then only the queued form is kept
+        envelope = MessageEnvelope.model_validate_json(
+            template.replace("{request_id}", str(uuid.uuid4()))
+        )
+        item = QueuedEnvelope.from_envelope(envelope) if compact else envelope
+        store.put(envelope.transportMetadata.requestId, item)
+
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    assert len(store) == REQUESTS
+
+    return retained / REQUESTS
+
+
+@pytest.mark.benchmark
+def test_bench_queue_memory_footprint(record_benchmark):
+    full = queued_footprint(compact=False)
+    compact = queued_footprint(compact=True)
+
+    record_benchmark("footprint", full, "bytes/request", queued="MessageEnvelope")
+    record_benchmark("footprint", compact, "bytes/request", queued="QueuedEnvelope")
+
+    assert compact < 0.75 * full
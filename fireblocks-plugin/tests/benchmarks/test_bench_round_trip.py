@@ -0,0 +1,91 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import time
+
+import pytest
+
+from fb.codec import decode_content
+from fb.plugin import FBPlugin
+from fb.types import (
+    MessageEnvelope,
+    MessageState,
+    MessagesRequest,
+    MessagesStatusRequest,
+)
+from fb.utils import model_dump_json
+
+from oso.framework.data.types import V1_3
+from oso.framework.plugin import current_oso_plugin_app
+
+
+ENVELOPES = 1_000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_bench_frontend_round_trip(
+    mode, client, fake_signing_server, make_envelopes, record_benchmark
+):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fake_signing_server.latency = 0
+
+    envelopes = make_envelopes(ENVELOPES)
+    request_ids = [envelope.transportMetadata.requestId for envelope in envelopes]
+    stages: dict[str, float] = {}
+
+    start = time.perf_counter()
+    fb_plugin.messagesToSign(MessagesRequest(messages=envelopes))
+    stages["messages_to_sign"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    documents = fb_plugin.to_oso().documents
+    stages["to_oso"] = time.perf_counter() - start
+
+    assert len(documents) == ENVELOPES
+
+    # What the backend sends back
+    signed_documents = []
+    for document in documents:
+        message_status = fb_plugin.sign(
+            MessageEnvelope.model_validate_json(decode_content(document.content))
+        )
+        signed_documents.append(
+            V1_3.Document(
+                id=document.id, content=model_dump_json(message_status), metadata=""
+            )
+        )
+
+    start = time.perf_counter()
+    fb_plugin.to_isv(
+        V1_3.DocumentList(documents=signed_documents, count=len(signed_documents))
+    )
+    stages["to_isv"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    response = fb_plugin.messagesStatus(MessagesStatusRequest(requestsIds=request_ids))
+    stages["messages_status"] = time.perf_counter() - start
+
+    assert [status.status for status in response.statuses] == [
+        MessageState.SIGNED
+    ] * ENVELOPES
+
+    for stage, elapsed in stages.items():
+        record_benchmark(
+            "stage_time", elapsed / ENVELOPES * 1e6, "us/envelope", stage=stage
+        )
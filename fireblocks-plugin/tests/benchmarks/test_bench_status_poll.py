@@ -0,0 +1,71 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import statistics
+import time
+
+import pytest
+
+from fb.plugin import FBPlugin
+from fb.types import MessagesStatusRequest, QueuedEnvelope
+
+from oso.framework.plugin import current_oso_plugin_app
+
+
+BACKLOG_SIZES = [1_000, 10_000, 100_000]
+POLLS = 200
+IDS_PER_POLL = 10
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_bench_messages_status_flat(mode, client, make_envelopes, record_benchmark):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    envelopes = make_envelopes(max(BACKLOG_SIZES))
+    latencies: dict[int, float] = {}
+    filled = 0
+
+    for size in BACKLOG_SIZES:
+        for envelope in envelopes[filled:size]:
+            fb_plugin.pending_messages.put(
+                envelope.transportMetadata.requestId,
+                QueuedEnvelope.from_envelope(envelope),
+            )
+        filled = size
+
+        requested = [
+            envelope.transportMetadata.requestId
+            for envelope in envelopes[size - IDS_PER_POLL : size]
+        ]
+        messages_status_request = MessagesStatusRequest(requestsIds=requested)
+
+        samples = []
+        for _ in range(POLLS):
+            start = time.perf_counter()
+            response = fb_plugin.messagesStatus(messages_status_request)
+            samples.append(time.perf_counter() - start)
+
+        assert len(response.statuses) == IDS_PER_POLL
+
+        latencies[size] = statistics.median(samples)
+        record_benchmark(
+            "median_poll_latency", latencies[size] * 1e6, "us", backlog=size
+        )
+
+    # Poll cost must not scale with the backlog
+    assert latencies[max(BACKLOG_SIZES)] < 3 * latencies[min(BACKLOG_SIZES)]
@@ -0,0 +1,68 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import statistics
+import time
+
+import pytest
+
+from fb.store import RequestStore, SQLiteJournal
+from fb.types import MessageEnvelope
+
+
+REQUESTS = 20_000
+
+
+@pytest.mark.benchmark
+def test_bench_journaled_enqueue_and_recovery(
+    tmp_path, make_envelopes, record_benchmark
+):
+    path = str(tmp_path / "store.sqlite3")
+    envelopes = make_envelopes(REQUESTS)
+
+    journal = SQLiteJournal(path)
+    store: RequestStore[MessageEnvelope] = RequestStore(
+        "pending", MessageEnvelope, journal
+    )
+
+    samples = []
+    for envelope in envelopes:
+        start = time.perf_counter()
+        store.put(envelope.transportMetadata.requestId, envelope)
+        samples.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    store.flush()
+    flush_latency = time.perf_counter() - start
+    journal.close()
+
+    start = time.perf_counter()
+    journal = SQLiteJournal(path)
+    store = RequestStore("pending", MessageEnvelope, journal)
+    recovery = time.perf_counter() - start
+    journal.close()
+
+    samples.sort()
+    p50 = statistics.median(samples)
+    p99 = samples[int(len(samples) * 0.99)]
+
+    record_benchmark("enqueue_p50", p50 * 1e6, "us", requests=REQUESTS)
+    record_benchmark("enqueue_p99", p99 * 1e6, "us", requests=REQUESTS)
+    record_benchmark("final_flush", flush_latency * 1e3, "ms", requests=REQUESTS)
+    record_benchmark("recovery", recovery * 1e3, "ms", requests=REQUESTS)
+
+    assert len(store) == REQUESTS
+    assert p50 < 1e-3
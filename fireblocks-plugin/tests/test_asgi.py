@@ -0,0 +1,284 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import json
+import time
+import uuid
+
+import pytest
+
+from fb.asgi import CustomerServerASGI
+from fb.plugin import FBPlugin
+from fb.types import MessagesRequest, MessagesStatusRequest
+
+from oso.framework.data.types import V1_3
+
+from oso.framework.plugin import current_oso_plugin_app
+
+
+HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"x-test-ssl-verify", b"True"),
+    (b"x-test-ssl-fingerprint", b"VALID"),
+]
+
+
+async def asgi_request(
+    asgi_app: CustomerServerASGI,
+    method: str,
+    path: str,
+    body: bytes = b"",
+    headers: list[tuple[bytes, bytes]] = HEADERS,
+    query_string: bytes = b"",
+) -> tuple[int, bytes]:
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await asgi_app(
+        {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "query_string": query_string,
+            "headers": headers,
+        },
+        receive,
+        send,
+    )
+
+    return sent[0]["status"], sent[1]["body"]
+
+
+with open("tests/data/messages_request.json", "r") as file:
+    messages_request = MessagesRequest.model_validate(json.load(file))
+
+request_id = messages_request.messages[0].transportMetadata.requestId
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_asgi_frontend_customer_server(mode, app):
+    asgi_app = CustomerServerASGI(app)
+
+    status, body = asyncio.run(
+        asgi_request(
+            asgi_app,
+            "POST",
+            "/internal/messagesToSign",
+            messages_request.model_dump_json().encode(),
+        )
+    )
+
+    assert status == 200
+    assert json.loads(body) == {
+        "statuses": [
+            {
+                "requestId": str(request_id),
+                "response": {},
+                "status": "PENDING_SIGN",
+                "type": "KEY_LINK_PROOF_OF_OWNERSHIP_RESPONSE",
+            }
+        ]
+    }
+
+    status, body = asyncio.run(
+        asgi_request(
+            asgi_app,
+            "POST",
+            "/internal/messagesStatus",
+            MessagesStatusRequest(requestsIds=[request_id]).model_dump_json().encode(),
+        )
+    )
+
+    assert status == 200
+    assert json.loads(body)["statuses"][0]["status"] == "PENDING_SIGN"
+
+    # Everything else is served by the Flask application
+    status, body = asyncio.run(
+        asgi_request(asgi_app, "GET", f"/api/{mode}/v1alpha1/documents")
+    )
+
+    assert status == 200
+    assert json.loads(body)["count"] == 1
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_asgi_rejects_unauthenticated(mode, app):
+    asgi_app = CustomerServerASGI(app)
+
+    status, _ = asyncio.run(
+        asgi_request(
+            asgi_app,
+            "POST",
+            "/internal/messagesToSign",
+            messages_request.model_dump_json().encode(),
+            headers=[*HEADERS[:2], (b"x-test-ssl-fingerprint", b"NOT_VALID")],
+        )
+    )
+
+    assert status != 200
+    assert len(current_oso_plugin_app().pending_messages) == 0
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_asgi_hot_mode_signs_concurrently(mode, app, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.config.hot_mode = True
+
+    def _sign(key_id, data):
+        time.sleep(0.1)
+        return data.hex()
+
+    mocker.patch.object(fb_plugin.signing_server, "sign", side_effect=_sign)
+
+    template = messages_request.messages[0]
+    envelopes = [
+        template.model_copy(
+            update={
+                "transportMetadata": template.transportMetadata.model_copy(
+                    update={"requestId": uuid.uuid4()}
+                )
+            }
+        )
+        for _ in range(8)
+    ]
+
+    asgi_app = CustomerServerASGI(app)
+
+    start = time.perf_counter()
+    status, body = asyncio.run(
+        asgi_request(
+            asgi_app,
+            "POST",
+            "/internal/messagesToSign",
+            MessagesRequest(messages=envelopes).model_dump_json().encode(),
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    assert status == 200
+    assert [status["status"] for status in json.loads(body)["statuses"]] == [
+        "SIGNED"
+    ] * 8
+    assert elapsed < 0.5
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_asgi_hot_mode_signs_duplicates_once(mode, app, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.config.hot_mode = True
+
+    def _sign(key_id, data):
+        time.sleep(0.1)
+        return data.hex()
+
+    sign = mocker.patch.object(fb_plugin.signing_server, "sign", side_effect=_sign)
+
+    asgi_app = CustomerServerASGI(app)
+    body = MessagesRequest(messages=messages_request.messages * 2).model_dump_json()
+
+    async def _load() -> list[tuple[int, bytes]]:
+        # A retry arriving while the first request is being signed
+        return await asyncio.gather(
+            *(
+                asgi_request(
+                    asgi_app, "POST", "/internal/messagesToSign", body.encode()
+                )
+                for _ in range(2)
+            )
+        )
+
+    for status, response_body in asyncio.run(_load()):
+        assert status == 200
+        assert [
+            status["status"] for status in json.loads(response_body)["statuses"]
+        ] == ["SIGNED"] * 2
+
+    assert sign.call_count == 1
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_asgi_rejects_websockets(mode, app):
+    asgi_app = CustomerServerASGI(app)
+    sent = []
+
+    async def receive():
+        return {"type": "websocket.connect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi_app({"type": "websocket", "path": "/"}, receive, send))
+
+    assert sent == [{"type": "websocket.close", "code": 1003}]
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_asgi_long_poll_does_not_hold_a_thread(mode, app):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    with open("tests/data/signed_doc.json", "r") as file:
+        signed_doc = V1_3.Document.model_validate(json.load(file))
+
+    fb_plugin.messagesToSign(messages_request)
+    fb_plugin.to_oso()
+
+    # A single thread, which long-polls must leave to other requests
+    asgi_app = CustomerServerASGI(app, max_threads=1)
+
+    async def _load():
+        poll = asyncio.ensure_future(
+            asgi_request(
+                asgi_app,
+                "POST",
+                "/internal/messagesStatus",
+                MessagesStatusRequest(requestsIds=[request_id])
+                .model_dump_json()
+                .encode(),
+                query_string=b"wait=10",
+            )
+        )
+
+        start = time.perf_counter()
+        status, _ = await asgi_request(
+            asgi_app, "GET", f"/api/{mode}/v1alpha1/documents"
+        )
+        assert status == 200
+        assert time.perf_counter() - start < 1
+
+        def _deliver():
+            with app.app_context():
+                fb_plugin.to_isv(V1_3.DocumentList(documents=[signed_doc], count=1))
+
+        await asyncio.get_running_loop().run_in_executor(None, _deliver)
+
+        return await asyncio.wait_for(poll, 5)
+
+    status, body = asyncio.run(_load())
+
+    assert status == 200
+    assert [status["status"] for status in json.loads(body)["statuses"]] == ["SIGNED"]
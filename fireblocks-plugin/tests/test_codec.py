@@ -0,0 +1,40 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from fb.codec import ZLIB_PREFIX, decode_content, encode_content
+
+
+CONTENT = '{"requestId":"a4963c1f-f2be-4e3c-9a3a-0d2627aaf9bc","status":"SIGNED"}'
+
+
+def test_identity_content_unchanged():
+    assert encode_content(CONTENT, "identity") == CONTENT
+    assert decode_content(CONTENT) == CONTENT
+
+
+def test_zlib_content_round_trip():
+    encoded = encode_content(CONTENT * 10, "zlib")
+
+    assert encoded.startswith(ZLIB_PREFIX)
+    assert len(encoded) < len(CONTENT * 10)
+    assert decode_content(encoded) == CONTENT * 10
+
+
+def test_zlib_content_corrupt():
+    with pytest.raises(Exception):
+        decode_content(ZLIB_PREFIX + "not base64!")
@@ -0,0 +1,73 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import logging
+
+import pytest
+
+from fb import log
+from fb.log import Lazy, Payload
+from fb.types import MessagesStatusRequest
+
+
+logger = logging.getLogger("fb.test")
+
+REQUEST = MessagesStatusRequest(requestsIds=[])
+
+
+@pytest.fixture
+def sample_rate():
+    yield
+    log.payload_sample_rate = 1.0
+
+
+def test_lazy_formatted_only_when_enabled(caplog):
+    calls = []
+
+    def render() -> str:
+        calls.append(None)
+        return "rendered"
+
+    with caplog.at_level(logging.INFO, logger="fb"):
+        logger.debug("value: %s", Lazy(render))
+        assert calls == []
+
+    with caplog.at_level(logging.DEBUG, logger="fb"):
+        logger.debug("value: %s", Lazy(render))
+        assert calls
+
+    assert caplog.messages == ["value: rendered"]
+
+
+def test_payload_sampling(caplog, sample_rate):
+    with caplog.at_level(logging.DEBUG, logger="fb"):
+        logger.debug("request: %s", Payload(REQUEST))
+
+        log.payload_sample_rate = 0
+        logger.debug("request: %s", Payload(REQUEST))
+
+    assert caplog.messages == [
+        'request: {"requestsIds":[]}',
+        "request: <MessagesStatusRequest not sampled>",
+    ]
+
+
+def test_lazy_repr(caplog):
+    with caplog.at_level(logging.DEBUG, logger="fb"):
+        logger.debug("body: %r", Lazy(lambda: b"{}"))
+
+    assert caplog.messages == ["body: b'{}'"]
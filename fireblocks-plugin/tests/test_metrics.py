@@ -0,0 +1,123 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+
+import pytest
+
+from fb.metrics import Registry
+from fb.plugin import FBPlugin
+
+from oso.framework.data.types import V1_3
+from oso.framework.plugin import current_oso_plugin_app
+
+
+def test_render():
+    registry = Registry()
+
+    counter = registry.counter("documents_total", "Documents.", ["kind"])
+    counter.inc(labels=("a",))
+    counter.inc(2, labels=("a",))
+    counter.inc(labels=('b"',))
+
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    registry.gauge("depth", "Depth.", lambda: 7)
+    registry.scraped_counter(
+        "evicted_total", "Evicted.", ["reason"], lambda: {("expired",): 2}
+    )
+
+    assert registry.render() == "\n".join(
+        [
+            "# HELP documents_total Documents.",
+            "# TYPE documents_total counter",
+            'documents_total{kind="a"} 3',
+            'documents_total{kind="b\\""} 1',
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1"} 2',
+            'latency_seconds_bucket{le="+Inf"} 3',
+            "latency_seconds_sum 5.55",
+            "latency_seconds_count 3",
+            "# HELP depth Depth.",
+            "# TYPE depth gauge",
+            "depth 7",
+            "# HELP evicted_total Evicted.",
+            "# TYPE evicted_total counter",
+            'evicted_total{reason="expired"} 2',
+            "",
+        ]
+    )
+
+
+def test_counts_across_threads():
+    registry = Registry()
+    counter = registry.counter("events_total", "Events.")
+    histogram = registry.histogram("latency_seconds", "Latency.")
+
+    def _record():
+        for _ in range(1000):
+            counter.inc()
+            histogram.observe(0.01)
+
+    threads = [threading.Thread(target=_record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+
+    # Some threads may still be running while scraped
+    registry.render()
+
+    for thread in threads:
+        thread.join()
+
+    _record()
+
+    assert counter.value() == 5000
+    assert histogram.count() == 5000
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_metrics_endpoint(mode, client):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.to_isv(
+        V1_3.DocumentList(
+            documents=[V1_3.Document(id="invalid", content="{}", metadata="")],
+            count=1,
+        )
+    )
+
+    response = client.get(
+        "/internal/metrics",
+        headers={
+            "X-TEST-SSL-VERIFY": "True",
+            "X-TEST-SSL-FINGERPRINT": "VALID",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+
+    lines = response.get_data(as_text=True).splitlines()
+
+    assert "fb_pending_messages 0" in lines
+    assert "fb_to_isv_documents_total 1" in lines
+    assert "fb_to_isv_failures_total 1" in lines
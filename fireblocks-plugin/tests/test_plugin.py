@@ -15,14 +15,27 @@
 #
 
 import json
+import random
+import threading
+import time
 from typing import TypeVar
 import uuid
 import pydantic
 import pytest
 import requests_mock
 
+from fb.codec import ZLIB_PREFIX, decode_content, encode_content
 from fb.plugin import FBPlugin, get_signing_api_endpoint
-from fb.types import MessagesRequest, MessagesStatusRequest, MessagesStatusResponse
+from fb.utils import model_dump_json
+from fb.types import (
+    Message,
+    MessageEnvelope,
+    MessageState,
+    MessageToSign,
+    MessagesRequest,
+    MessagesStatusRequest,
+    MessagesStatusResponse,
+)
 
 from oso.framework.data.types import V1_3
 from oso.framework.plugin import current_oso_plugin_app
@@ -47,6 +60,30 @@ signed_doc = load_model("tests/data/signed_doc.json", V1_3.Document)
 messages_request = load_model("tests/data/messages_request.json", MessagesRequest)
 
 
+def make_envelope(count: int) -> MessageEnvelope:
+    envelope = messages_request.messages[0]
+    payload = envelope.message.parsed_payload.model_copy(
+        update={
+            "messagesToSign": [
+                MessageToSign(message=f"{index:064x}", index=index)
+                for index in range(count)
+            ]
+        }
+    )
+
+    return envelope.model_copy(
+        update={
+            "message": Message(
+                payloadSignatureData=envelope.message.payloadSignatureData,
+                payload=payload.model_dump_json(by_alias=True),
+            ),
+            "transportMetadata": envelope.transportMetadata.model_copy(
+                update={"requestId": uuid.uuid4()}
+            ),
+        }
+    )
+
+
 @pytest.mark.parametrize("mode", ["frontend"])
 def test_frontend_isv2oso(mode, client):
     response = client.post(
@@ -154,6 +191,9 @@ def test_min_keys(mode, client):
     fb_plugin = current_oso_plugin_app()
     assert isinstance(fb_plugin, FBPlugin)
 
+    fb_plugin.start_warmup().join()
+    assert fb_plugin.warmup_state == "ready"
+
     secp256k1_keys = fb_plugin.signing_server.list_keys(key_type=KeyType.SECP256K1)
     assert len(secp256k1_keys) == 2
 
@@ -216,6 +256,11 @@ def test_frontend_status(mode, client):
 
 @pytest.mark.parametrize("mode", ["backend"])
 def test_backend_status(mode, client):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.start_warmup().join()
+
     with requests_mock.Mocker() as mock:
         mock.get(f"{get_signing_api_endpoint()}/status", text="OK")
 
@@ -231,3 +276,657 @@ def test_backend_status(mode, client):
     assert V1_3.ComponentStatus.model_validate_json(
         response.data
     ) == V1_3.ComponentStatus(status_code=200, status="OK")
+
+
+@pytest.mark.parametrize("mode", ["backend"])
+def test_backend_status_coalesces_health_checks(mode, app, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.start_warmup().join()
+    fb_plugin.config.health_check_ttl = 0.2
+
+    def _health_check():
+        time.sleep(0.1)
+        return V1_3.ComponentStatus(status_code=200, status="OK")
+
+    health_check = mocker.patch.object(
+        fb_plugin.signing_server.addon, "health_check", side_effect=_health_check
+    )
+
+    def _status():
+        with app.app_context():
+            assert fb_plugin.status().status_code == 200
+
+    threads = [threading.Thread(target=_status) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One probe for the whole storm, cached for the next caller
+    assert health_check.call_count == 1
+    fb_plugin.status()
+    assert health_check.call_count == 1
+
+    time.sleep(0.2)
+
+    fb_plugin.status()
+    assert health_check.call_count == 2
+
+
+@pytest.mark.parametrize("mode", ["backend"])
+def test_backend_status_during_warmup(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    provisioned = threading.Event()
+    mocker.patch.object(
+        fb_plugin, "provision_keys", side_effect=lambda: provisioned.wait(5)
+    )
+
+    response = client.get(
+        f"/api/{mode}/v1alpha1/status",
+        headers={
+            "X-TEST-SSL-VERIFY": "True",
+            "X-TEST-SSL-FINGERPRINT": "VALID",
+        },
+    )
+
+    assert V1_3.ComponentStatus.model_validate_json(
+        response.data
+    ) == V1_3.ComponentStatus(status_code=503, status="Provisioning signing keys")
+
+    provisioned.set()
+    fb_plugin.start_warmup().join()
+
+    assert fb_plugin.warmup_state == "ready"
+    assert fb_plugin.warmup_status() is None
+
+
+@pytest.mark.parametrize("mode", ["backend"])
+def test_sign_concurrent_keeps_index_order(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    def _sign(key_id, data):
+        time.sleep(random.uniform(0, 0.01))
+        return f"sig-{data.hex()}"
+
+    mocker.patch.object(fb_plugin.signing_server, "sign", side_effect=_sign)
+
+    message_status = fb_plugin.sign(make_envelope(16))
+
+    assert message_status.status == MessageState.SIGNED
+    assert [m.index for m in message_status.response.signedMessages] == list(range(16))
+    assert all(
+        m.signature == f"sig-{m.message}"
+        for m in message_status.response.signedMessages
+    )
+
+
+@pytest.mark.parametrize("mode", ["backend"])
+def test_sign_records_per_message_errors(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    def _sign(key_id, data):
+        if int(data.hex(), 16) == 1:
+            raise RuntimeError("HSM unavailable")
+        return f"sig-{data.hex()}"
+
+    mocker.patch.object(fb_plugin.signing_server, "sign", side_effect=_sign)
+
+    message_status = fb_plugin.sign(make_envelope(3))
+
+    assert message_status.status == MessageState.FAILED
+    assert message_status.response.errorMessage == (
+        "Failed to sign messages at index 1"
+    )
+    assert [m.index for m in message_status.response.signedMessages] == [0, 2]
+
+
+@pytest.mark.parametrize("mode", ["backend"])
+def test_sign_invalid_hex_is_not_a_signing_error(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    sign = mocker.patch.object(
+        fb_plugin.signing_server, "sign", side_effect=lambda key_id, data: "sig"
+    )
+
+    envelope = make_envelope(2)
+    payload = envelope.message.parsed_payload.model_copy(
+        update={
+            "messagesToSign": [
+                MessageToSign(message="not hex", index=0),
+                *envelope.message.parsed_payload.messagesToSign[1:],
+            ]
+        }
+    )
+    envelope = envelope.model_copy(
+        update={
+            "message": Message(
+                payloadSignatureData=envelope.message.payloadSignatureData,
+                payload=payload.model_dump_json(by_alias=True),
+            )
+        }
+    )
+
+    message_status = fb_plugin.sign(envelope)
+
+    assert message_status.status == MessageState.FAILED
+    assert message_status.response.errorMessage == (
+        "Failed to sign messages at index 0"
+    )
+    assert [m.index for m in message_status.response.signedMessages] == [1]
+    assert sign.call_count == 1
+    assert fb_plugin.signing_error is None
+
+
+@pytest.mark.parametrize("mode", ["backend"])
+def test_signing_error_recovers(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.config.signing_recovery_successes = 3
+    healthy = False
+
+    def _sign(key_id, data):
+        if not healthy:
+            raise RuntimeError("HSM unavailable")
+        return f"sig-{data.hex()}"
+
+    mocker.patch.object(fb_plugin.signing_server, "sign", side_effect=_sign)
+
+    assert fb_plugin.sign(make_envelope(1)).status == MessageState.FAILED
+    assert fb_plugin.signing_error
+
+    healthy = True
+
+    assert fb_plugin.sign(make_envelope(2)).status == MessageState.SIGNED
+    assert fb_plugin.signing_error
+
+    assert fb_plugin.sign(make_envelope(1)).status == MessageState.SIGNED
+    assert not fb_plugin.signing_error
+
+
+@pytest.mark.parametrize("mode", ["backend"])
+def test_sign_sheds_load_when_circuit_opens(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    # One call at a time, so the circuit opens after exactly two
+    fb_plugin.config.sign_concurrency = 1
+    fb_plugin.signing_server.breaker.failure_threshold = 2
+    fb_plugin.signing_server.retries = 0
+
+    sign = mocker.patch.object(
+        fb_plugin.signing_server.addon, "sign", side_effect=ConnectionError("down")
+    )
+
+    message_status = fb_plugin.sign(make_envelope(4))
+
+    assert message_status.status == MessageState.FAILED
+    assert message_status.response.errorMessage == (
+        "Failed to sign messages at index 0, 1, 2, 3"
+    )
+    assert fb_plugin.signing_server.breaker.state == "open"
+    assert sign.call_count == 2
+
+
+@pytest.mark.parametrize("mode", ["backend"])
+def test_backend_pipelined_to_isv_keeps_document_order(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    def _sign(key_id, data):
+        time.sleep(random.uniform(0, 0.01))
+        return f"sig-{data.hex()}"
+
+    mocker.patch.object(fb_plugin.signing_server, "sign", side_effect=_sign)
+
+    envelopes = [make_envelope(2) for _ in range(12)]
+    documents = [
+        V1_3.Document(
+            id=str(envelope.transportMetadata.requestId),
+            content=model_dump_json(envelope),
+            metadata="",
+        )
+        for envelope in envelopes
+    ]
+    documents.insert(5, V1_3.Document(id="invalid", content="{}", metadata=""))
+
+    assert fb_plugin.to_isv(
+        V1_3.DocumentList(documents=documents, count=len(documents))
+    ) == ["OK"]
+
+    document_list = fb_plugin.to_oso()
+
+    assert document_list.count == len(envelopes)
+    assert [doc.id for doc in document_list.documents] == [
+        str(envelope.transportMetadata.requestId) for envelope in envelopes
+    ]
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_evictions_are_metrics(mode, client):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.signed_statuses.max_bytes = 1
+
+    fb_plugin.to_isv(V1_3.DocumentList(documents=[signed_doc], count=1))
+
+    headers = {
+        "X-TEST-SSL-VERIFY": "True",
+        "X-TEST-SSL-FINGERPRINT": "VALID",
+    }
+    response = client.get(f"/api/{mode}/v1alpha1/status", headers=headers)
+
+    component_status = V1_3.ComponentStatus.model_validate_json(response.data)
+
+    # Past evictions are nothing to act on
+    assert response.status_code == 200
+    assert component_status.errors == []
+
+    response = client.get("/internal/metrics", headers=headers)
+    lines = response.get_data(as_text=True).splitlines()
+    size = fb_plugin.signed_statuses.stats()["evicted_bytes_over_budget"]
+
+    assert size > 0
+    assert 'fb_signed_statuses_evicted_total{reason="over_budget"} 1' in lines
+    assert 'fb_signed_statuses_evicted_total{reason="expired"} 0' in lines
+    assert (
+        f'fb_signed_statuses_evicted_bytes_total{{reason="over_budget"}} {size}'
+        in lines
+    )
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_messages_to_sign_idempotent(mode, client):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    request_id = messages_request.messages[0].transportMetadata.requestId
+
+    def _messages_to_sign() -> MessageState:
+        response = fb_plugin.messagesToSign(messages_request)
+        assert [status.requestId for status in response.statuses] == [request_id]
+        return response.statuses[0].status
+
+    assert _messages_to_sign() == MessageState.PENDING_SIGN
+    assert _messages_to_sign() == MessageState.PENDING_SIGN
+    assert fb_plugin.to_oso().count == 1
+
+    # Shipped to the backend, still pending and not queued again
+    assert _messages_to_sign() == MessageState.PENDING_SIGN
+    assert fb_plugin.to_oso().count == 0
+
+    fb_plugin.to_isv(V1_3.DocumentList(documents=[signed_doc], count=1))
+    assert _messages_to_sign() == MessageState.SIGNED
+
+    response = fb_plugin.messagesStatus(MessagesStatusRequest(requestsIds=[request_id]))
+    assert [status.status for status in response.statuses] == [MessageState.SIGNED]
+
+    # Already handed to the agent, still not signed twice
+    assert _messages_to_sign() == MessageState.SIGNED
+    assert fb_plugin.to_oso().count == 0
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_to_oso_bounded_batches(mode, client):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    envelopes = [make_envelope(1) for _ in range(5)]
+    request_ids = [str(envelope.transportMetadata.requestId) for envelope in envelopes]
+
+    fb_plugin.messagesToSign(MessagesRequest(messages=envelopes))
+    fb_plugin.config.to_oso_max_documents = 2
+
+    batches = [[doc.id for doc in fb_plugin.to_oso().documents] for _ in range(4)]
+    assert batches == [request_ids[0:2], request_ids[2:4], request_ids[4:5], []]
+
+    fb_plugin.messagesToSign(
+        MessagesRequest(messages=[make_envelope(1) for _ in range(3)])
+    )
+    fb_plugin.config.to_oso_max_documents = 1000
+    fb_plugin.config.to_oso_max_bytes = 1
+
+    # An oversized document still goes out on its own
+    assert [fb_plugin.to_oso().count for _ in range(4)] == [1, 1, 1, 0]
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_to_oso_flushes(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.messagesToSign(messages_request)
+    flush = mocker.spy(fb_plugin.pending_messages, "flush")
+
+    assert fb_plugin.to_oso().count == 1
+    flush.assert_called_once()
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_retry_during_hand_off(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    request_id = messages_request.messages[0].transportMetadata.requestId
+    fb_plugin.messagesToSign(messages_request)
+
+    retried = []
+
+    def retry_after(store, name):
+        original = getattr(store, name)
+
+        def _retry(*args, **kwargs):
+            result = original(*args, **kwargs)
+            retried.extend(fb_plugin.messagesToSign(messages_request).statuses)
+            return result
+
+        mocker.patch.object(store, name, side_effect=_retry)
+
+    # A retry lands while the request moves from pending to in flight
+    retry_after(fb_plugin.pending_messages, "pop")
+    assert fb_plugin.to_oso().count == 1
+    assert len(fb_plugin.pending_messages) == 0
+
+    # And while the signed status moves out of in flight
+    retry_after(fb_plugin.in_flight, "pop")
+    fb_plugin.to_isv(V1_3.DocumentList(documents=[signed_doc], count=1))
+    assert len(fb_plugin.pending_messages) == 0
+
+    assert [status.status for status in retried] == [
+        MessageState.PENDING_SIGN,
+        MessageState.SIGNED,
+    ]
+    assert fb_plugin.to_oso().count == 0
+
+    response = fb_plugin.messagesStatus(MessagesStatusRequest(requestsIds=[request_id]))
+    assert [status.status for status in response.statuses] == [MessageState.SIGNED]
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_compressed_content(mode, client):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.config.content_encoding = "zlib"
+    fb_plugin.messagesToSign(messages_request)
+
+    document_list = fb_plugin.to_oso()
+
+    assert document_list.documents[0].content.startswith(ZLIB_PREFIX)
+    assert decode_content(document_list.documents[0].content) == unsigned_doc.content
+
+    compressed_signed_doc = signed_doc.model_copy(
+        update={"content": encode_content(signed_doc.content, "zlib")}
+    )
+    fb_plugin.to_isv(V1_3.DocumentList(documents=[compressed_signed_doc], count=1))
+
+    response = fb_plugin.messagesStatus(
+        MessagesStatusRequest(
+            requestsIds=[uuid.UUID("a4963c1f-f2be-4e3c-9a3a-0d2627aaf9bc")]
+        )
+    )
+
+    assert response == load_model(
+        "tests/data/signed_messages_status_response.json", MessagesStatusResponse
+    )
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_messages_status_long_poll(mode, app, client):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    request_id = messages_request.messages[0].transportMetadata.requestId
+    messages_status_request = MessagesStatusRequest(requestsIds=[request_id])
+
+    fb_plugin.messagesToSign(messages_request)
+    fb_plugin.to_oso()
+
+    # Nothing arrives, times out with the request still pending
+    start = time.perf_counter()
+    response = fb_plugin.messagesStatus(messages_status_request, wait=0.2)
+    assert time.perf_counter() - start >= 0.2
+    assert [status.status for status in response.statuses] == [
+        MessageState.PENDING_SIGN
+    ]
+
+    def _deliver():
+        time.sleep(0.1)
+        with app.app_context():
+            fb_plugin.to_isv(V1_3.DocumentList(documents=[signed_doc], count=1))
+
+    thread = threading.Thread(target=_deliver)
+    thread.start()
+
+    # Returns as soon as the signed status lands
+    start = time.perf_counter()
+    response = client.post(
+        "/internal/messagesStatus?wait=10",
+        data=messages_status_request.model_dump_json(),
+        content_type="application/json",
+        headers={
+            "X-TEST-SSL-VERIFY": "True",
+            "X-TEST-SSL-FINGERPRINT": "VALID",
+        },
+        environ_overrides={"wsgi.multithread": True},
+    )
+    elapsed = time.perf_counter() - start
+    thread.join()
+
+    assert response.status_code == 200
+    assert [status["status"] for status in response.get_json()["statuses"]] == [
+        "SIGNED"
+    ]
+    assert elapsed < 5
+
+    # Unknown ids can't change state, no waiting
+    start = time.perf_counter()
+    fb_plugin.messagesStatus(MessagesStatusRequest(requestsIds=[uuid.uuid4()]), 10)
+    assert time.perf_counter() - start < 1
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_messages_status_sync_worker_does_not_wait(mode, client):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    request_id = messages_request.messages[0].transportMetadata.requestId
+    fb_plugin.messagesToSign(messages_request)
+    fb_plugin.to_oso()
+
+    # Waiting would keep the to_isv that signs it from being served
+    start = time.perf_counter()
+    response = client.post(
+        "/internal/messagesStatus?wait=10",
+        data=MessagesStatusRequest(requestsIds=[request_id]).model_dump_json(),
+        content_type="application/json",
+        headers={
+            "X-TEST-SSL-VERIFY": "True",
+            "X-TEST-SSL-FINGERPRINT": "VALID",
+        },
+        environ_overrides={"wsgi.multithread": False},
+    )
+
+    assert response.status_code == 200
+    assert [status["status"] for status in response.get_json()["statuses"]] == [
+        "PENDING_SIGN"
+    ]
+    assert time.perf_counter() - start < 5
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_hot_mode_async(mode, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.config.hot_mode = True
+    fb_plugin.config.hot_mode_async = True
+    fb_plugin.config.hot_queue_max = 1
+
+    release = threading.Event()
+
+    def _sign(key_id, data):
+        release.wait(5)
+        return data.hex()
+
+    mocker.patch.object(fb_plugin.signing_server, "sign", side_effect=_sign)
+
+    envelope = make_envelope(2)
+    request_id = envelope.transportMetadata.requestId
+
+    # Acknowledged before anything is signed
+    response = fb_plugin.messagesToSign(MessagesRequest(messages=[envelope]))
+    assert [status.status for status in response.statuses] == [
+        MessageState.PENDING_SIGN
+    ]
+
+    # The queue is full
+    response = client.post(
+        "/internal/messagesToSign",
+        data=MessagesRequest(messages=[make_envelope(1)]).model_dump_json(),
+        content_type="application/json",
+        headers={
+            "X-TEST-SSL-VERIFY": "True",
+            "X-TEST-SSL-FINGERPRINT": "VALID",
+        },
+    )
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == str(fb_plugin.config.overload_retry_after)
+
+    release.set()
+
+    response = fb_plugin.messagesStatus(
+        MessagesStatusRequest(requestsIds=[request_id]), wait=5
+    )
+
+    assert [status.status for status in response.statuses] == [MessageState.SIGNED]
+    assert [m.index for m in response.statuses[0].response.signedMessages] == [0, 1]
+    assert fb_plugin.hot_queue_depth == 0
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_hot_mode_async_concurrent_retries(mode, app, client, mocker):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.config.hot_mode = True
+    fb_plugin.config.hot_mode_async = True
+
+    sign = mocker.patch.object(
+        fb_plugin.signing_server, "sign", side_effect=lambda key_id, data: data.hex()
+    )
+
+    envelope = make_envelope(1)
+    barrier = threading.Barrier(8)
+
+    def _retry():
+        with app.test_request_context():
+            barrier.wait()
+            fb_plugin.messagesToSign(MessagesRequest(messages=[envelope]))
+
+    threads = [threading.Thread(target=_retry) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    response = fb_plugin.messagesStatus(
+        MessagesStatusRequest(requestsIds=[envelope.transportMetadata.requestId]),
+        wait=5,
+    )
+
+    assert [status.status for status in response.statuses] == [MessageState.SIGNED]
+    assert sign.call_count == 1
+
+
+@pytest.fixture
+def shared_store(monkeypatch, tmp_path):
+    monkeypatch.setenv("FB__STORE_BACKEND", "shared")
+    monkeypatch.setenv("FB__STORE_PATH", str(tmp_path / "shared.sqlite3"))
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_shared_store_across_workers(mode, shared_store, client):
+    worker_a = current_oso_plugin_app()
+    assert isinstance(worker_a, FBPlugin)
+
+    # A second gunicorn worker on the same database
+    worker_b = FBPlugin()
+
+    request_id = messages_request.messages[0].transportMetadata.requestId
+
+    worker_a.messagesToSign(messages_request)
+
+    # Retried against the other worker, not queued twice
+    worker_b.messagesToSign(messages_request)
+    assert worker_b.to_oso().documents == [unsigned_doc]
+    assert worker_a.to_oso().count == 0
+
+    worker_a.to_isv(V1_3.DocumentList(documents=[signed_doc], count=1))
+
+    response = worker_b.messagesStatus(
+        MessagesStatusRequest(requestsIds=[request_id]), wait=1
+    )
+    assert [status.status for status in response.statuses] == [MessageState.SIGNED]
+
+    # Handed over exactly once
+    response = worker_a.messagesStatus(MessagesStatusRequest(requestsIds=[request_id]))
+    assert response.statuses == []
+
+
+@pytest.mark.parametrize("mode", ["frontend"])
+def test_frontend_admission_control(mode, client):
+    fb_plugin = current_oso_plugin_app()
+    assert isinstance(fb_plugin, FBPlugin)
+
+    fb_plugin.config.pending_high_watermark = 3
+    fb_plugin.config.pending_low_watermark = 2
+    fb_plugin.config.overload_retry_after = 7
+
+    def post(count: int):
+        return client.post(
+            "/internal/messagesToSign",
+            data=MessagesRequest(
+                messages=[make_envelope(1) for _ in range(count)]
+            ).model_dump_json(),
+            content_type="application/json",
+            headers={
+                "X-TEST-SSL-VERIFY": "True",
+                "X-TEST-SSL-FINGERPRINT": "VALID",
+            },
+        )
+
+    # Too big on its own, waiting wouldn't help and nothing of it is queued
+    response = post(4)
+    assert response.status_code == 413
+    assert "Retry-After" not in response.headers
+    assert len(fb_plugin.pending_messages) == 0
+
+    assert post(2).status_code == 200
+    assert post(1).status_code == 200
+
+    response = post(1)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "7"
+
+    assert [error.code for error in fb_plugin.status().errors] == ["QUEUE-OVERLOADED"]
+
+    # Shipped requests still count until they are signed
+    request_ids = [uuid.UUID(doc.id) for doc in fb_plugin.to_oso().documents]
+    assert post(1).status_code == 429
+
+    # Still overloaded above the low watermark
+    fb_plugin.in_flight.pop(request_ids[0])
+    assert post(1).status_code == 429
+
+    fb_plugin.in_flight.pop(request_ids[1])
+    assert post(1).status_code == 200
+    assert fb_plugin.status().errors == []
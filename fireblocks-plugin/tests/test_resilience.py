@@ -0,0 +1,157 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import enum
+import time
+
+import pytest
+
+from fb.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientSigningServer,
+    is_transient,
+)
+
+
+class StatusCode(enum.Enum):
+    UNAVAILABLE = 14
+    INVALID_ARGUMENT = 3
+
+
+class FakeRpcError(Exception):
+    def __init__(self, code: StatusCode) -> None:
+        super().__init__(code.name)
+        self._code = code
+
+    def code(self) -> StatusCode:
+        return self._code
+
+
+class FaultySigningServer:
+    """Signing server that fails or stalls according to a script."""
+
+    def __init__(self, faults: tuple = (), latency: float = 0) -> None:
+        self.faults = list(faults)
+        self.latency = latency
+        self.calls = 0
+
+    def sign(self, key_id, data):
+        self.calls += 1
+        time.sleep(self.latency)
+
+        if self.faults:
+            fault = self.faults.pop(0)
+            if fault is not None:
+                raise fault
+
+        return data.hex()
+
+
+def make_server(
+    addon: FaultySigningServer,
+    failure_threshold: int = 3,
+    reset_timeout: float = 0.1,
+    slow_call_threshold: float = 0.05,
+    deadline: float = 1,
+    retries: int = 2,
+) -> ResilientSigningServer:
+    return ResilientSigningServer(
+        addon,
+        CircuitBreaker(failure_threshold, reset_timeout, slow_call_threshold),
+        deadline=deadline,
+        retries=retries,
+        backoff=0.001,
+        backoff_max=0.01,
+        max_workers=4,
+    )
+
+
+def test_is_transient():
+    assert is_transient(TimeoutError())
+    assert is_transient(FakeRpcError(StatusCode.UNAVAILABLE))
+    assert not is_transient(FakeRpcError(StatusCode.INVALID_ARGUMENT))
+    assert not is_transient(ValueError())
+
+
+def test_retries_transient_errors():
+    addon = FaultySigningServer(faults=[FakeRpcError(StatusCode.UNAVAILABLE)] * 2)
+    server = make_server(addon)
+
+    assert server.sign(key_id="key", data=b"\x01") == "01"
+    assert addon.calls == 3
+
+
+def test_does_not_retry_permanent_errors():
+    addon = FaultySigningServer(faults=[FakeRpcError(StatusCode.INVALID_ARGUMENT)])
+    server = make_server(addon)
+
+    with pytest.raises(FakeRpcError):
+        server.sign(key_id="key", data=b"\x01")
+
+    assert addon.calls == 1
+
+
+def test_deadline():
+    addon = FaultySigningServer(latency=0.5)
+    server = make_server(addon, deadline=0.1)
+
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        server.sign(key_id="key", data=b"\x01")
+
+    assert time.perf_counter() - start < 0.3
+
+
+def test_circuit_opens_and_probes():
+    addon = FaultySigningServer(faults=[ConnectionError("HSM down")] * 3)
+    server = make_server(addon, retries=0)
+
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            server.sign(key_id="key", data=b"\x01")
+
+    # Shed without calling the signing server
+    with pytest.raises(CircuitOpenError):
+        server.sign(key_id="key", data=b"\x01")
+    assert addon.calls == 3
+
+    time.sleep(0.1)
+
+    # A slow probe keeps the circuit open
+    addon.latency = 0.1
+    assert server.sign(key_id="key", data=b"\x01") == "01"
+    assert server.breaker.state == "open"
+
+    time.sleep(0.1)
+
+    addon.latency = 0
+    assert server.sign(key_id="key", data=b"\x01") == "01"
+    assert server.breaker.state == "closed"
+
+
+def test_permanent_errors_keep_the_circuit_closed():
+    addon = FaultySigningServer(
+        faults=[FakeRpcError(StatusCode.INVALID_ARGUMENT), KeyError("unknown key")] * 3
+    )
+    server = make_server(addon)
+
+    for _ in range(6):
+        with pytest.raises((FakeRpcError, KeyError)):
+            server.sign(key_id="key", data=b"\x01")
+
+    assert server.breaker.state == "closed"
+    assert server.sign(key_id="key", data=b"\x01") == "01"
@@ -0,0 +1,375 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import multiprocessing
+import sqlite3
+import threading
+
+from uuid import UUID, uuid4
+
+import pytest
+
+import fb.store
+
+from fb.store import RequestStore, SQLiteJournal, SQLiteRequestStore
+from fb.types import MessageResponse, MessageState, MessageStatus, ResponseType
+
+
+def make_status(request_id: UUID) -> MessageStatus:
+    return MessageStatus(
+        response_type=ResponseType.KEY_LINK_TX_SIGN_RESPONSE,
+        status=MessageState.SIGNED,
+        requestId=request_id,
+        response=MessageResponse(signedMessages=[]),
+    )
+
+
+def test_store_put_get_pop():
+    store: RequestStore[str] = RequestStore()
+    request_id = uuid4()
+
+    store.put(request_id, "a")
+
+    assert request_id in store
+    assert len(store) == 1
+    assert store.get(request_id) == "a"
+
+    assert store.pop(request_id) == "a"
+    assert request_id not in store
+    assert store.pop(request_id) is None
+    assert store.get(request_id) is None
+
+
+def test_store_drain_is_fifo():
+    store: RequestStore[int] = RequestStore()
+    request_ids = [uuid4() for _ in range(10)]
+
+    for i, request_id in enumerate(request_ids):
+        store.put(request_id, i)
+
+    store.pop(request_ids[3])
+
+    assert list(store) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert store.drain() == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert len(store) == 0
+    assert store.drain() == []
+
+
+def test_store_put_existing_keeps_position():
+    store: RequestStore[str] = RequestStore()
+    first, second = uuid4(), uuid4()
+
+    store.put(first, "a")
+    store.put(second, "b")
+    store.put(first, "c")
+
+    assert store.drain() == ["c", "b"]
+
+
+def test_store_recovers_from_sqlite_journal(tmp_path):
+    path = str(tmp_path / "store.sqlite3")
+    request_ids = [uuid4() for _ in range(5)]
+
+    journal = SQLiteJournal(path)
+    store: RequestStore[MessageStatus] = RequestStore("signed", MessageStatus, journal)
+
+    for request_id in request_ids:
+        store.put(request_id, make_status(request_id))
+
+    store.pop(request_ids[1])
+    store.flush()
+    journal.close()
+
+    journal = SQLiteJournal(path)
+    store = RequestStore("signed", MessageStatus, journal)
+
+    assert [status.requestId for status in store] == [
+        request_ids[0],
+        request_ids[2],
+        request_ids[3],
+        request_ids[4],
+    ]
+    assert store.get(request_ids[2]) == make_status(request_ids[2])
+
+    store.drain()
+    store.put(request_ids[0], make_status(request_ids[0]))
+    journal.close()
+
+    journal = SQLiteJournal(path)
+    store = RequestStore("signed", MessageStatus, journal)
+    other: RequestStore[MessageStatus] = RequestStore("pending", MessageStatus, journal)
+
+    assert [status.requestId for status in store] == [request_ids[0]]
+    assert len(other) == 0
+    journal.close()
+
+
+def put_journaled(journal: SQLiteJournal, request_id: UUID) -> None:
+    store: RequestStore[MessageStatus] = RequestStore("signed", MessageStatus, journal)
+    store.put(request_id, make_status(request_id))
+    store.flush()
+
+
+def test_sqlite_journal_after_fork(tmp_path):
+    path = str(tmp_path / "store.sqlite3")
+    journal = SQLiteJournal(path)
+    request_id = uuid4()
+
+    # Created before the fork, as with a preloading server
+    context = multiprocessing.get_context("fork")
+    worker = context.Process(target=put_journaled, args=(journal, request_id))
+    worker.start()
+    worker.join(10)
+    assert worker.exitcode == 0
+
+    store: RequestStore[MessageStatus] = RequestStore("signed", MessageStatus, journal)
+    assert [status.requestId for status in store] == [request_id]
+    journal.close()
+
+
+def test_sqlite_journal_single_writer(tmp_path):
+    path = str(tmp_path / "store.sqlite3")
+    journal = SQLiteJournal(path)
+    put_journaled(journal, uuid4())
+
+    context = multiprocessing.get_context("fork")
+    worker = context.Process(target=put_journaled, args=(journal, uuid4()))
+    worker.start()
+    worker.join(10)
+
+    # A second worker must not ship the same journal
+    assert worker.exitcode != 0
+    journal.close()
+
+
+def test_sqlite_journal_flush_timeout(tmp_path, monkeypatch):
+    journal = SQLiteJournal(str(tmp_path / "store.sqlite3"))
+    journal.put("signed", uuid4(), "{}")
+    monkeypatch.setattr(journal, "FLUSH_TIMEOUT", 0.1)
+
+    # Writer stuck on a lock held elsewhere
+    writer = sqlite3.connect(journal.path, isolation_level=None, timeout=0)
+    writer.execute("BEGIN IMMEDIATE")
+
+    try:
+        journal.put("signed", uuid4(), "{}")
+
+        with pytest.raises(TimeoutError):
+            journal.flush()
+
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+    journal.close()
+
+
+def test_store_evicts_expired(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(fb.store.time, "monotonic", lambda: now)
+
+    store: RequestStore[str] = RequestStore(ttl=60)
+    old, new = uuid4(), uuid4()
+
+    store.put(old, "old")
+    now += 30
+    store.put(new, "new")
+    now += 45
+
+    assert store.evict() == 1
+    assert old not in store
+    assert store.get(new) == "new"
+    assert store.stats()["evicted_expired"] == 1
+
+
+def test_store_evicts_oldest_over_budget():
+    store: RequestStore[MessageStatus] = RequestStore(max_bytes=250)
+    request_ids = [uuid4() for _ in range(3)]
+
+    for request_id in request_ids:
+        store.put(request_id, make_status(request_id), size=100)
+
+    assert store.stats()["bytes"] == 300
+    assert store.evict() == 1
+    assert request_ids[0] not in store
+    assert store.stats() == {
+        "entries": 2,
+        "bytes": 200,
+        "evicted_expired": 0,
+        "evicted_over_budget": 1,
+        "evicted_bytes_expired": 0,
+        "evicted_bytes_over_budget": 100,
+    }
+
+    store.pop(request_ids[1])
+    assert store.stats()["bytes"] == 100
+
+    # Sizes default to the encoded length
+    store.put(request_ids[0], make_status(request_ids[0]))
+    assert store.stats()["bytes"] == 100 + len(
+        make_status(request_ids[0]).model_dump_json(by_alias=True, exclude_none=True)
+    )
+
+
+def test_store_peek_does_not_remove():
+    store: RequestStore[int] = RequestStore()
+    request_ids = [uuid4() for _ in range(3)]
+
+    for i, request_id in enumerate(request_ids):
+        store.put(request_id, i)
+
+    assert store.peek(2) == [(request_ids[0], 0), (request_ids[1], 1)]
+    assert store.peek() == list(zip(request_ids, [0, 1, 2]))
+    assert len(store) == 3
+
+
+def put_statuses(path: str, request_ids: list[UUID]) -> None:
+    store = SQLiteRequestStore(path, "signed", MessageStatus)
+
+    for request_id in request_ids:
+        store.put(request_id, make_status(request_id))
+
+
+def test_shared_store_across_processes(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    store = SQLiteRequestStore(path, "signed", MessageStatus)
+
+    batches = [[uuid4() for _ in range(50)] for _ in range(4)]
+
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=put_statuses, args=(path, batch)) for batch in batches
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0
+
+    assert len(store) == 200
+    assert {status.requestId for status in store} == {
+        request_id for batch in batches for request_id in batch
+    }
+
+    # Another worker's view of the same store, each request is popped once
+    other = SQLiteRequestStore(path, "signed", MessageStatus)
+    request_id = batches[0][0]
+
+    assert other.pop(request_id) == make_status(request_id)
+    assert store.pop(request_id) is None
+    assert request_id not in store
+
+    # Stores with other names are separate
+    assert len(SQLiteRequestStore(path, "pending", MessageStatus)) == 0
+
+
+def test_shared_store_is_fifo(tmp_path):
+    store = SQLiteRequestStore(
+        str(tmp_path / "shared.sqlite3"), "signed", MessageStatus
+    )
+    request_ids = [uuid4() for _ in range(5)]
+
+    for request_id in request_ids:
+        store.put(request_id, make_status(request_id))
+
+    # Replacing keeps the position
+    store.put(request_ids[0], make_status(request_ids[0]))
+
+    assert [request_id for request_id, _ in store.peek(2)] == request_ids[:2]
+    assert [status.requestId for status in store.drain()] == request_ids
+    assert len(store) == 0
+
+
+def test_shared_store_evicts(tmp_path, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(fb.store.time, "time", lambda: now)
+
+    store = SQLiteRequestStore(
+        str(tmp_path / "shared.sqlite3"),
+        "signed",
+        MessageStatus,
+        ttl=60,
+        max_bytes=250,
+    )
+    request_ids = [uuid4() for _ in range(4)]
+
+    store.put(request_ids[0], make_status(request_ids[0]), size=100)
+    now += 30
+
+    for request_id in request_ids[1:]:
+        store.put(request_id, make_status(request_id), size=100)
+
+    now += 45
+
+    # The first expired, then the second goes to get under the budget
+    assert store.evict() == 2
+    assert [request_id for request_id, _ in store.peek()] == request_ids[2:]
+    assert store.stats() == {
+        "entries": 2,
+        "bytes": 200,
+        "evicted_expired": 1,
+        "evicted_over_budget": 1,
+        "evicted_bytes_expired": 100,
+        "evicted_bytes_over_budget": 100,
+    }
+
+
+def pop_shared(
+    store: SQLiteRequestStore, inherited: sqlite3.Connection, request_id: UUID
+) -> None:
+    assert store._conn is not inherited
+    assert store.pop(request_id) is not None
+
+
+def test_shared_store_after_fork(tmp_path):
+    store = SQLiteRequestStore(
+        str(tmp_path / "shared.sqlite3"), "signed", MessageStatus
+    )
+    request_id = uuid4()
+    store.put(request_id, make_status(request_id))
+
+    # The parent's connection is not used by the forked worker
+    context = multiprocessing.get_context("fork")
+    worker = context.Process(target=pop_shared, args=(store, store._conn, request_id))
+    worker.start()
+    worker.join(10)
+    assert worker.exitcode == 0
+
+    assert request_id not in store
+
+
+def test_shared_store_evict_without_write_lock(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    store = SQLiteRequestStore(path, "signed", MessageStatus, ttl=60, max_bytes=250)
+    request_id = uuid4()
+    store.put(request_id, make_status(request_id), size=100)
+
+    # Another worker holds the write lock
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+
+    try:
+        thread = threading.Thread(target=store.evict)
+        thread.start()
+        thread.join(1)
+
+        # Nothing to evict, so it didn't queue for the lock
+        assert not thread.is_alive()
+
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+        thread.join()
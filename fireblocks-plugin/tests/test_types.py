@@ -13,3 +13,56 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+
+import json
+
+from fb.types import MessageEnvelope, QueuedEnvelope, RequestType
+from fb.utils import model_dump_json
+
+
+PAYLOAD = (
+    '{ "tenantId": "bd8c5871-f8cc-5c0b-8eac-9dd8bc30899a",'
+    ' "type": "KEY_LINK_TX_SIGN_REQUEST", "algorithm": "ECDSA_SECP256K1",'
+    ' "signingDeviceKeyId": "46c3933b", "keyId":'
+    ' "ab79ca1a-45cc-4cbe-b48c-6b7caa1336cd", "messagesToSign":'
+    ' [{"message": "de31ce29", "index": 0}] }'
+)
+
+CONTENT = json.dumps(
+    {
+        "message": {
+            "payloadSignatureData": {"signature": "00", "service": "CM"},
+            "payload": PAYLOAD,
+        },
+        "transportMetadata": {
+            "requestId": "a4963c1f-f2be-4e3c-9a3a-0d2627aaf9bc",
+            "type": "KEY_LINK_TX_SIGN_REQUEST",
+        },
+    }
+)
+
+
+def test_message_payload_kept_verbatim():
+    message_envelope = MessageEnvelope.model_validate_json(CONTENT)
+
+    assert "parsed_payload" not in message_envelope.message.__dict__
+    assert message_envelope.message.payload == PAYLOAD
+
+    parsed_payload = message_envelope.message.parsed_payload
+    assert parsed_payload.request_type == RequestType.KEY_LINK_TX_SIGN_REQUEST
+    assert parsed_payload.messagesToSign[0].message == "de31ce29"
+
+    round_trip = MessageEnvelope.model_validate_json(model_dump_json(message_envelope))
+    assert round_trip.message.payload == PAYLOAD
+
+
+def test_queued_envelope_round_trip():
+    message_envelope = MessageEnvelope.model_validate_json(CONTENT)
+    queued = QueuedEnvelope.from_envelope(message_envelope)
+
+    assert queued.transportMetadata == message_envelope.transportMetadata
+    assert queued.envelope() == message_envelope
+    assert queued.model_dump_json() == model_dump_json(message_envelope)
+
+    # As recovered from a store journal
+    assert QueuedEnvelope.model_validate_json(queued.model_dump_json()) == queued
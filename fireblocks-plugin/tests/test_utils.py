@@ -0,0 +1,40 @@
+#
+# (c) Copyright IBM Corp. 2025
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import json
+
+import flask
+
+from fb.types import MessagesStatusResponse
+from fb.utils import model_dump, model_response
+
+
+def test_model_response_matches_jsonify():
+    with open("tests/data/signed_messages_status_response.json", "r") as file:
+        messages_status_response = MessagesStatusResponse.model_validate(
+            json.load(file)
+        )
+
+    app = flask.Flask(__name__)
+
+    with app.app_context():
+        response = model_response(messages_status_response)
+        expected = flask.jsonify(model_dump(messages_status_response))
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.get_data().endswith(b"}\n")
+    assert json.loads(response.get_data()) == json.loads(expected.get_data())